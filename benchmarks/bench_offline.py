@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import argparse
+import base64
+import contextlib
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable
+
+import cv2
+import numpy as np
+import sklearn
+
+from sign_translator.dataset import load_dataset_index
+from sign_translator.frames import FramePayload
+from sign_translator.landmarks import (
+    build_feature_dataset,
+    extract_feature_vector_from_frame,
+    extract_sequence_from_video,
+)
+from sign_translator.sign_index import SignIndex
+from train_model import build_model
+
+
+def timed(fn: Callable[[], object], repeat: int) -> tuple[float, object]:
+    """Median wall time (s) of `repeat` calls, plus the last return value."""
+    durations = []
+    value = None
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        value = fn()
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations), value
+
+
+def metric(value: float, unit: str, higher_is_better: bool, **extra) -> dict:
+    return {"value": round(value, 4), "unit": unit, "higher_is_better": higher_is_better, **extra}
+
+
+def make_synthetic_videos(root: Path, labels: int, per_label: int, frames: int, width: int, height: int) -> None:
+    """Small moving-pattern mp4s named '<word>_<vid-id>.mp4' like the scraped dataset."""
+    rng = np.random.default_rng(0)
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    for label_index in range(labels):
+        for take in range(per_label):
+            path = root / f"Kelime{label_index:03d}_{100 + label_index}-{take:02d}.mp4"
+            writer = cv2.VideoWriter(str(path), fourcc, 25.0, (width, height))
+            base = rng.integers(0, 255, (height, width, 3), dtype=np.uint8)
+            for index in range(frames):
+                frame = np.roll(base, shift=(label_index + 1) * index, axis=1)
+                writer.write(frame)
+            writer.release()
+
+
+def run_suite(args: argparse.Namespace) -> dict:
+    results: dict[str, dict] = {}
+    rng = np.random.default_rng(42)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        video_dir = root / "videos"
+        video_dir.mkdir()
+        make_synthetic_videos(video_dir, args.labels, args.per_label, args.video_frames, args.width, args.height)
+        items = load_dataset_index(video_dir)
+
+        frame = rng.integers(0, 255, (args.height, args.width, 3), dtype=np.uint8)
+        seconds, _ = timed(
+            lambda: [extract_feature_vector_from_frame(frame, frame_size=args.frame_size) for _ in range(200)],
+            args.repeat,
+        )
+        results["extract_feature_vector_from_frame"] = metric(200 / seconds, "frames/s", True)
+
+        # Server hot path: full colour decode vs. the grayscale decode FramePayload picks,
+        # on a smooth camera-like frame (noise is the JPEG worst case and unrepresentative).
+        scene = np.tile(np.linspace(40, 200, args.width, dtype=np.uint8)[None, :, None], (args.height, 1, 3))
+        cv2.circle(scene, (args.width // 2, args.height // 3), args.height // 5, (180, 140, 120), -1)
+        _, encoded = cv2.imencode(".jpg", cv2.GaussianBlur(scene + (frame // 24), (3, 3), 0))
+        image_base64 = base64.b64encode(encoded.tobytes()).decode("ascii")
+
+        def decode_full() -> np.ndarray:
+            jpeg = np.frombuffer(base64.b64decode(image_base64), dtype=np.uint8)
+            return cv2.imdecode(jpeg, cv2.IMREAD_COLOR)
+
+        seconds, _ = timed(
+            lambda: [extract_feature_vector_from_frame(decode_full(), frame_size=args.frame_size) for _ in range(200)],
+            args.repeat,
+        )
+        results["decode_features_full"] = metric(200 / seconds, "frames/s", True)
+        seconds, _ = timed(
+            lambda: [
+                extract_feature_vector_from_frame(
+                    FramePayload(image_base64).gray(args.frame_size), frame_size=args.frame_size
+                )
+                for _ in range(200)
+            ],
+            args.repeat,
+        )
+        results["decode_features_payload"] = metric(200 / seconds, "frames/s", True)
+
+        video_path = items[0].path
+        seconds, _ = timed(
+            lambda: extract_sequence_from_video(
+                video_path, sequence_len=args.sequence_len, max_frames=args.video_frames, frame_size=args.frame_size
+            ),
+            args.repeat,
+        )
+        results["extract_sequence_from_video"] = metric(args.video_frames / seconds, "frames/s", True)
+
+        seconds, samples = timed(
+            lambda: build_feature_dataset(
+                items, sequence_len=args.sequence_len, max_frames=args.video_frames, frame_size=args.frame_size
+            ),
+            1,
+        )
+        results["build_feature_dataset"] = metric(len(items) / seconds, "videos/s", True, videos=len(items))
+
+        X = np.stack([s.features for s in samples], axis=0)
+        y = np.array([s.label for s in samples])
+        vid = np.array([s.vid_id for s in samples])
+        # Scale the store up to a realistic archive size for the load benchmark.
+        reps = max(1, args.store_samples // len(X))
+        npz_path = root / "sign_dataset.npz"
+        np.savez_compressed(npz_path, X=np.tile(X, (reps, 1, 1)), y=np.tile(y, reps), vid=np.tile(vid, reps))
+
+        def load_npz():
+            data = np.load(npz_path, allow_pickle=True)
+            return data["X"], data["y"]
+
+        seconds, (X_store, y_store) = timed(load_npz, args.repeat)
+        results["npz_load"] = metric(seconds * 1000, "ms", False, samples=len(X_store), bytes=npz_path.stat().st_size)
+
+        X_flat = X_store.reshape(len(X_store), -1)
+        model = build_model()
+        seconds, _ = timed(lambda: model.fit(X_flat, y_store), 1)
+        results["model_fit"] = metric(seconds, "s", False, samples=len(X_flat), features=X_flat.shape[1])
+
+        single = X_flat[:1]
+        seconds, _ = timed(lambda: [model.predict_proba(single) for _ in range(50)], args.repeat)
+        results["predict_proba_single"] = metric(seconds / 50 * 1000, "ms", False)
+        batch = X_flat[: args.batch_size]
+        seconds, _ = timed(lambda: model.predict_proba(batch), args.repeat)
+        results["predict_proba_batch"] = metric(len(batch) / seconds, "samples/s", True, batch=len(batch))
+
+        index = SignIndex(X_store, y_store, np.tile(vid, reps))
+        queries = X_store[: args.batch_size]
+        seconds, _ = timed(lambda: [index.query(q, k=5) for q in queries[:50]], args.repeat)
+        results["sign_index_query"] = metric(seconds / min(50, len(queries)) * 1000, "ms", False, index_size=len(index))
+        seconds, _ = timed(lambda: index.query_batch(queries, k=5), args.repeat)
+        results["sign_index_query_batch"] = metric(len(queries) / seconds, "queries/s", True)
+
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Names of metrics that got worse than the baseline by more than `threshold` (relative)."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous or not previous.get("value"):
+            continue
+        change = (current["value"] - previous["value"]) / previous["value"]
+        current["change_vs_baseline"] = round(change, 4)
+        worse = -change if current["higher_is_better"] else change
+        if worse > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark offline extraction, training and sign-index paths")
+    parser.add_argument("--labels", type=int, default=10)
+    parser.add_argument("--per-label", type=int, default=3)
+    parser.add_argument("--video-frames", type=int, default=60)
+    parser.add_argument("--width", type=int, default=320)
+    parser.add_argument("--height", type=int, default=240)
+    parser.add_argument("--sequence-len", type=int, default=30)
+    parser.add_argument("--frame-size", type=int, default=32)
+    parser.add_argument("--store-samples", type=int, default=2000, help="Samples in the npz/fit/index benchmarks")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="", help="JSON result path (default: stdout)")
+    parser.add_argument("--baseline", default="", help="Earlier JSON result to compare against")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Relative slowdown flagged as regression")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    # Library progress prints go to stderr so stdout stays valid JSON.
+    with contextlib.redirect_stdout(sys.stderr):
+        results = run_suite(args)
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "numpy": np.__version__,
+            "opencv": cv2.__version__,
+            "sklearn": sklearn.__version__,
+        },
+        "config": vars(args),
+        "results": results,
+    }
+
+    regressions: list[str] = []
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold)
+        report["regressions"] = regressions
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(output, encoding="utf-8")
+        print(f"[bench] saved: {args.output}")
+    else:
+        print(output)
+
+    for name in regressions:
+        print(f"[bench] REGRESSION {name}: {results[name]['change_vs_baseline']:+.1%}", file=sys.stderr)
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
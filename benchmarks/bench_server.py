@@ -0,0 +1,420 @@
+from __future__ import annotations
+
+import argparse
+import base64
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from pathlib import Path
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import cv2
+import numpy as np
+import requests
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(values: list[float], q: float) -> float:
+    return float(np.percentile(values, q)) if values else 0.0
+
+
+def read_rss_mb(pid: int) -> float | None:
+    """Resident set size of a process from /proc (Linux); None elsewhere."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        return None
+    return None
+
+
+class FakeRoboflow:
+    """Local stand-in for the Roboflow HTTP endpoint with configurable latency and error rate."""
+
+    def __init__(self, latency_ms: float, jitter_ms: float, error_rate: float, labels: list[str], model_id: str):
+        self.model_id = model_id
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.labels = labels
+        self.port = free_port()
+        self.server = ThreadingHTTPServer(("127.0.0.1", self.port), self._handler())
+        self.server.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                # inference_sdk talks to non-Roboflow hosts as a self-hosted server and
+                # checks the model registry first; report every model as loaded.
+                body = json.dumps({"models": [{"model_id": fake.model_id, "task_type": "object-detection"}]}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                self.rfile.read(length)
+                delay = max(0.0, random.gauss(fake.latency_ms, fake.jitter_ms)) / 1000.0
+                time.sleep(delay)
+                if random.random() < fake.error_rate:
+                    body = b'{"error": "fake upstream failure"}'
+                    self.send_response(503)
+                else:
+                    label = random.choice(fake.labels)
+                    body = json.dumps(
+                        {"predictions": [{"class": label, "confidence": random.uniform(0.3, 0.99)}]}
+                    ).encode()
+                    self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def start(self) -> None:
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def synthetic_frames(count: int, width: int, height: int) -> list[str]:
+    """Moving-gradient JPEG frames as data URLs, like the extension's canvas.toDataURL output."""
+    frames = []
+    xs = np.linspace(0, 255, width, dtype=np.float32)
+    for index in range(count):
+        img = np.zeros((height, width, 3), dtype=np.uint8)
+        img[:, :, 0] = ((xs + index * 12) % 256).astype(np.uint8)
+        img[:, :, 1] = np.linspace(0, 255, height, dtype=np.uint8)[:, None]
+        cx = int((index * 17) % width)
+        cv2.circle(img, (cx, height // 2), height // 6, (255, 255, 255), -1)
+        frames.append(encode_data_url(img))
+    return frames
+
+
+def encode_data_url(img: np.ndarray) -> str:
+    ok, encoded = cv2.imencode(".jpg", img, [int(cv2.IMWRITE_JPEG_QUALITY), 75])
+    if not ok:
+        raise ValueError("Image encoding failed")
+    return "data:image/jpeg;base64," + base64.b64encode(encoded.tobytes()).decode("ascii")
+
+
+def recorded_frames(source: str, count: int, width: int, height: int) -> list[str]:
+    """Frames from a directory of images or from a video file, resized to the capture size."""
+    path = Path(source)
+    images: list[np.ndarray] = []
+    if path.is_dir():
+        for image_path in sorted(path.iterdir())[:count]:
+            img = cv2.imread(str(image_path), cv2.IMREAD_COLOR)
+            if img is not None:
+                images.append(img)
+    else:
+        cap = cv2.VideoCapture(str(path))
+        while len(images) < count:
+            ok, img = cap.read()
+            if not ok:
+                break
+            images.append(img)
+        cap.release()
+    if not images:
+        raise RuntimeError(f"No frames read from {source}")
+    return [encode_data_url(cv2.resize(img, (width, height), interpolation=cv2.INTER_AREA)) for img in images]
+
+
+class Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies_ms: list[float] = []
+        self.sent = 0
+        self.errors = 0
+        self.shed = 0
+        self.frames = 0
+
+    def add(self, latency_ms: float, frames: int, failed: int) -> None:
+        with self._lock:
+            self.sent += 1
+            self.frames += frames
+            self.errors += failed
+            self.latencies_ms.append(latency_ms)
+
+    def add_shed(self, frames: int) -> None:
+        with self._lock:
+            self.shed += frames
+
+    def snapshot(self) -> tuple[int, int, int, int]:
+        with self._lock:
+            return self.sent, self.frames, self.errors, self.shed
+
+
+def run_client(
+    client_id: int,
+    server_url: str,
+    sessions: int,
+    fps: float,
+    duration_s: float,
+    frames: list[str],
+    batch: bool,
+    timeout_s: float,
+    recorder: Recorder,
+) -> None:
+    """
+    One simulated browser tab owning `sessions` tiles. Frames are scheduled open-loop at
+    `fps`; a tick that comes due while the previous request is still running is counted
+    as shed (the extension would skip it too).
+    """
+    http = requests.Session()
+    session_ids = [f"bench-{client_id}-{tile}" for tile in range(sessions)]
+    interval = 1.0 / fps
+    started = time.monotonic()
+    next_tick = started + random.uniform(0.0, interval)
+    frame_index = client_id
+
+    while True:
+        now = time.monotonic()
+        if now - started >= duration_s:
+            break
+        if now < next_tick:
+            time.sleep(next_tick - now)
+            continue
+        late_ticks = int((now - next_tick) / interval)
+        if late_ticks:
+            recorder.add_shed(late_ticks * sessions)
+        next_tick += (late_ticks + 1) * interval
+
+        frame = frames[frame_index % len(frames)]
+        frame_index += 1
+        t0 = time.perf_counter()
+        failed = 0
+        try:
+            if batch:
+                payload = {"tiles": [{"session_id": sid, "image_base64": frame} for sid in session_ids]}
+                response = http.post(f"{server_url}/predict_batch", json=payload, timeout=timeout_s)
+                data = response.json() if response.ok else {"error": response.status_code}
+                if "error" in data:
+                    failed = sessions
+                else:
+                    failed = sum(1 for result in data.get("results", []) if "error" in result)
+            else:
+                for sid in session_ids:
+                    response = http.post(
+                        f"{server_url}/predict", json={"session_id": sid, "image_base64": frame}, timeout=timeout_s
+                    )
+                    if not response.ok or "error" in response.json():
+                        failed += 1
+        except Exception:
+            failed = sessions
+        recorder.add((time.perf_counter() - t0) * 1000.0, sessions, failed)
+
+    http.close()
+
+
+def wait_ready(url: str, proc: subprocess.Popen, timeout_s: float) -> tuple[float, float | None, dict]:
+    """
+    Seconds until the server answers /health (socket bound) and until /ready reports
+    ready, plus the server's own startup phase timings.
+    """
+    started = time.monotonic()
+    bound_s = None
+    status: dict = {}
+    while time.monotonic() - started < timeout_s:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Server exited with code {proc.returncode}")
+        try:
+            if bound_s is None and requests.get(f"{url}/health", timeout=1).ok:
+                bound_s = time.monotonic() - started
+            if bound_s is not None:
+                response = requests.get(f"{url}/ready", timeout=1)
+                if response.status_code == 404:
+                    return bound_s, bound_s, {}
+                status = response.json()
+                if response.ok:
+                    return bound_s, time.monotonic() - started, status.get("phases", {})
+                if status.get("phase") == "failed":
+                    raise RuntimeError(f"Server startup failed: {status.get('error')}")
+        except (requests.RequestException, ValueError):
+            pass
+        time.sleep(0.05)
+    detail = f" (phase: {status.get('phase')}, error: {status.get('error') or '-'})" if status else ""
+    raise RuntimeError(f"Server did not become ready in time{detail}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test serve_inference.py against a fake Roboflow endpoint")
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent simulated tabs")
+    parser.add_argument("--sessions-per-client", type=int, default=1, help="Tiles per tab")
+    parser.add_argument("--fps", type=float, default=2.0, help="Frames per second per tab")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds of load")
+    parser.add_argument("--batch", action="store_true", help="Use /predict_batch instead of one /predict per tile")
+    parser.add_argument("--fake-latency-ms", type=float, default=80.0)
+    parser.add_argument("--fake-jitter-ms", type=float, default=20.0)
+    parser.add_argument("--fake-error-rate", type=float, default=0.0)
+    parser.add_argument("--backends", default="roboflow", help="Passed to serve_inference.py (priority order)")
+    parser.add_argument("--classifier", default="models/sign_classifier.joblib", help="For the classifier backend")
+    parser.add_argument("--sign-index", default="models/sign_index.npz", help="For the index backend")
+    parser.add_argument("--frames", default="", help="Directory of images or a video file (default: synthetic)")
+    parser.add_argument("--width", type=int, default=320)
+    parser.add_argument("--height", type=int, default=240)
+    parser.add_argument("--timeout", type=float, default=7.0, help="Client timeout, same as the extension")
+    parser.add_argument("--server-url", default="", help="Benchmark an already running server instead")
+    parser.add_argument("--sample-interval", type=float, default=1.0)
+    parser.add_argument("--output", default="", help="JSON result path (default: stdout)")
+    args = parser.parse_args()
+
+    labels = ["merhaba", "tesekkurler", "evet", "hayir", "anlamak"]
+    frames = (
+        recorded_frames(args.frames, 120, args.width, args.height)
+        if args.frames
+        else synthetic_frames(60, args.width, args.height)
+    )
+
+    fake = None
+    proc = None
+    dataset_dir = None
+    startup: dict = {}
+    server_url = args.server_url.rstrip("/")
+    if not server_url:
+        fake = FakeRoboflow(args.fake_latency_ms, args.fake_jitter_ms, args.fake_error_rate, labels, "bench/1")
+        fake.start()
+        dataset_dir = tempfile.TemporaryDirectory()
+        for label in labels:
+            Path(dataset_dir.name, f"{label}_00-01.mp4").touch()
+        port = free_port()
+        server_url = f"http://127.0.0.1:{port}"
+        proc = subprocess.Popen(
+            [
+                sys.executable, str(REPO_ROOT / "serve_inference.py"),
+                "--api-key", "bench", "--model-id", "bench/1", "--api-url", fake.url,
+                "--dataset", dataset_dir.name, "--min-confidence", "0.0",
+                # Resolved here: the server runs from the repo root, not the caller's directory.
+                "--backends", args.backends,
+                "--classifier", str(Path(args.classifier).resolve()),
+                "--sign-index", str(Path(args.sign_index).resolve()),
+                "--host", "127.0.0.1", "--port", str(port),
+            ],
+            cwd=str(REPO_ROOT),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    try:
+        if proc is not None:
+            bound_s, ready_s, phases = wait_ready(server_url, proc, timeout_s=60.0)
+            startup = {"bound_s": round(bound_s, 3), "ready_s": round(ready_s, 3), "phases": phases}
+
+        recorder = Recorder()
+        timeline: list[dict] = []
+        stop = threading.Event()
+        load_started = time.monotonic()
+
+        def sample() -> None:
+            last_sent = 0
+            while not stop.wait(args.sample_interval):
+                sent, frame_count, errors, shed = recorder.snapshot()
+                timeline.append(
+                    {
+                        "t": round(time.monotonic() - load_started, 2),
+                        "rss_mb": read_rss_mb(proc.pid) if proc is not None else None,
+                        "requests": sent,
+                        "rps": round((sent - last_sent) / args.sample_interval, 2),
+                        "frames": frame_count,
+                        "errors": errors,
+                        "shed": shed,
+                    }
+                )
+                last_sent = sent
+
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+        with ThreadPoolExecutor(max_workers=args.clients) as executor:
+            for client_id in range(args.clients):
+                executor.submit(
+                    run_client, client_id, server_url, args.sessions_per_client, args.fps,
+                    args.duration, frames, args.batch, args.timeout, recorder,
+                )
+        elapsed = time.monotonic() - load_started
+        stop.set()
+        sampler.join()
+
+        # Per-backend latency/error/hedge counters, to see how the router split the load.
+        try:
+            routing = requests.get(f"{server_url}/health", timeout=args.timeout).json().get("routing")
+        except (requests.RequestException, ValueError):
+            routing = None
+
+        offered = recorder.frames + recorder.shed
+        rss_values = [point["rss_mb"] for point in timeline if point["rss_mb"] is not None]
+        result = {
+            "config": vars(args),
+            "startup": startup,
+            "summary": {
+                "elapsed_s": round(elapsed, 2),
+                "requests": recorder.sent,
+                "frames": recorder.frames,
+                "throughput_rps": round(recorder.sent / elapsed, 2),
+                "throughput_fps": round(recorder.frames / elapsed, 2),
+                "latency_ms": {
+                    "p50": round(percentile(recorder.latencies_ms, 50), 2),
+                    "p95": round(percentile(recorder.latencies_ms, 95), 2),
+                    "p99": round(percentile(recorder.latencies_ms, 99), 2),
+                    "max": round(max(recorder.latencies_ms, default=0.0), 2),
+                },
+                "error_rate": round(recorder.errors / recorder.frames, 4) if recorder.frames else 0.0,
+                "shed_rate": round(recorder.shed / offered, 4) if offered else 0.0,
+                "rss_mb_max": max(rss_values) if rss_values else None,
+            },
+            "routing": routing,
+            "timeline": timeline,
+        }
+    finally:
+        if proc is not None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        if fake is not None:
+            fake.stop()
+        if dataset_dir is not None:
+            dataset_dir.cleanup()
+
+    output = json.dumps(result, indent=2)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(output, encoding="utf-8")
+        print(f"[bench] saved: {args.output}")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,10 @@ const LOCAL_API_URLS = [
   "http://127.0.0.1:8000/predict",
   "http://localhost:8000/predict",
 ];
+const LOCAL_BATCH_API_URLS = [
+  "http://127.0.0.1:8000/predict_batch",
+  "http://localhost:8000/predict_batch",
+];
 const ALLOW_DIRECT_ROBOFLOW_FALLBACK = false;
 
 chrome.runtime.onInstalled.addListener(() => {
@@ -72,13 +76,13 @@ async function inferRoboflow(imageBase64, timeoutMs = 12000) {
   }
 }
 
-async function inferLocalApi(payload, timeoutMs = 7000) {
+async function inferLocalApi(payload, timeoutMs = 7000, urls = LOCAL_API_URLS) {
   const controller = new AbortController();
   const timeout = setTimeout(() => controller.abort(), timeoutMs);
 
   try {
     let lastError = null;
-    for (const url of LOCAL_API_URLS) {
+    for (const url of urls) {
       try {
         const res = await fetch(url, {
           method: "POST",
@@ -104,7 +108,42 @@ async function inferLocalApi(payload, timeoutMs = 7000) {
   }
 }
 
+async function inferRoboflowBatch(tiles, timeoutMs = 12000) {
+  const results = await Promise.all(
+    tiles.map(async (tile) => {
+      try {
+        const data = await inferRoboflow(tile.image_base64, timeoutMs);
+        return { ...data, session_id: tile.session_id };
+      } catch (error) {
+        return { error: String(error), session_id: tile.session_id };
+      }
+    })
+  );
+  return { results };
+}
+
+function handlePredictBatch(message, sendResponse) {
+  (async () => {
+    try {
+      const data = await inferLocalApi(message.payload, 7000, LOCAL_BATCH_API_URLS);
+      sendResponse({ ok: true, data });
+    } catch (error) {
+      if (ALLOW_DIRECT_ROBOFLOW_FALLBACK) {
+        const data = await inferRoboflowBatch(message.payload.tiles || [], 12000);
+        sendResponse({ ok: true, data });
+        return;
+      }
+      sendResponse({ ok: false, error: String(error || "local merged api unreachable") });
+    }
+  })();
+}
+
 chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
+  if (message && message.type === "predict_batch") {
+    handlePredictBatch(message, sendResponse);
+    return true;
+  }
+
   if (!message || message.type !== "predict") {
     return;
   }
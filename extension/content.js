@@ -1,41 +1,167 @@
-const SESSION_ID = "meet-session-1";
+const SESSION_PREFIX = "meet-tile";
 const FRAME_INTERVAL_MS = 500;
+const FRAME_WIDTH = 320;
+const FRAME_HEIGHT = 240;
+const MIN_TICK_MS = 100;
+const MAX_TICK_MS = 3000;
 
 let canvas = document.createElement("canvas");
 let ctx = canvas.getContext("2d");
-let overlay = null;
+let statusOverlay = null;
+let nextTileId = 1;
+const tileSessions = new WeakMap();
+const tileOverlays = new Map();
+// Server-recommended pacing per session: { dueAt, intervalMs, width, height }.
+const tilePacing = new Map();
+
+function pacingFor(sessionId) {
+  let pacing = tilePacing.get(sessionId);
+  if (!pacing) {
+    pacing = { dueAt: 0, intervalMs: FRAME_INTERVAL_MS, width: FRAME_WIDTH, height: FRAME_HEIGHT };
+    tilePacing.set(sessionId, pacing);
+  }
+  return pacing;
+}
+
+function applyPacing(sessionId, recommended, sentAt) {
+  const pacing = pacingFor(sessionId);
+  // A successful reply also ends any backoff.
+  pacing.intervalMs = Number(recommended?.next_interval_ms) || FRAME_INTERVAL_MS;
+  if (recommended) {
+    pacing.width = Number(recommended.width) || FRAME_WIDTH;
+    pacing.height = Number(recommended.height) || FRAME_HEIGHT;
+  }
+  pacing.dueAt = sentAt + pacing.intervalMs;
+}
+
+function backOffPacing(sessionId, sentAt) {
+  // Failed or timed out: double the interval so an overloaded server is not hit harder.
+  const pacing = pacingFor(sessionId);
+  pacing.intervalMs = Math.min(MAX_TICK_MS, pacing.intervalMs * 2);
+  pacing.dueAt = sentAt + pacing.intervalMs;
+}
+
+function nextTickDelay() {
+  const now = Date.now();
+  let earliest = now + FRAME_INTERVAL_MS;
+  for (const pacing of tilePacing.values()) {
+    earliest = Math.min(earliest, pacing.dueAt);
+  }
+  return Math.min(MAX_TICK_MS, Math.max(MIN_TICK_MS, earliest - now));
+}
+
+function createOverlayBox() {
+  const box = document.createElement("div");
+  box.style.position = "fixed";
+  box.style.zIndex = "999999";
+  box.style.background = "rgba(0,0,0,0.8)";
+  box.style.color = "#fff";
+  box.style.padding = "10px 14px";
+  box.style.borderRadius = "8px";
+  box.style.fontSize = "14px";
+  box.style.fontFamily = "Arial, sans-serif";
+  box.style.pointerEvents = "none";
+  document.body.appendChild(box);
+  return box;
+}
 
 function ensureOverlay() {
-  if (overlay) return;
-  overlay = document.createElement("div");
-  overlay.style.position = "fixed";
-  overlay.style.right = "20px";
-  overlay.style.bottom = "20px";
-  overlay.style.zIndex = "999999";
-  overlay.style.background = "rgba(0,0,0,0.8)";
-  overlay.style.color = "#fff";
-  overlay.style.padding = "10px 14px";
-  overlay.style.borderRadius = "8px";
-  overlay.style.fontSize = "14px";
-  overlay.style.fontFamily = "Arial, sans-serif";
-  overlay.textContent = "Sign: waiting...";
-  document.body.appendChild(overlay);
+  if (statusOverlay) return;
+  statusOverlay = createOverlayBox();
+  statusOverlay.style.right = "20px";
+  statusOverlay.style.bottom = "20px";
+  statusOverlay.textContent = "Sign: waiting...";
+}
+
+function findVisibleVideos() {
+  return Array.from(document.querySelectorAll("video")).filter((v) => {
+    if (v.videoWidth <= 0 || v.videoHeight <= 0) return false;
+    const rect = v.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0 && rect.bottom > 0 && rect.right > 0
+      && rect.top < window.innerHeight && rect.left < window.innerWidth;
+  });
 }
 
-function findActiveVideo() {
-  const videos = Array.from(document.querySelectorAll("video"));
-  return videos.find((v) => v.videoWidth > 0 && v.videoHeight > 0) || null;
+function sessionIdFor(video) {
+  let id = tileSessions.get(video);
+  if (!id) {
+    // Meet tags participant tiles with data-participant-id; fall back to a per-element counter.
+    const tile = video.closest("[data-participant-id]");
+    const participant = tile ? tile.getAttribute("data-participant-id") : "";
+    id = participant ? `${SESSION_PREFIX}-${participant}` : `${SESSION_PREFIX}-${nextTileId++}`;
+    tileSessions.set(video, id);
+  }
+  return id;
+}
+
+function tileOverlayFor(sessionId, video) {
+  let box = tileOverlays.get(sessionId);
+  if (!box) {
+    box = createOverlayBox();
+    box.style.fontSize = "13px";
+    box.style.padding = "6px 10px";
+    tileOverlays.set(sessionId, box);
+  }
+  const rect = video.getBoundingClientRect();
+  box.style.left = `${Math.round(rect.left + 8)}px`;
+  box.style.top = `${Math.round(rect.bottom - 40)}px`;
+  return box;
 }
 
-async function sendFrame(video) {
-  canvas.width = 320;
-  canvas.height = 240;
+function removeStaleOverlays(activeIds) {
+  for (const [sessionId, box] of tileOverlays) {
+    if (!activeIds.has(sessionId)) {
+      box.remove();
+      tileOverlays.delete(sessionId);
+    }
+  }
+  for (const sessionId of tilePacing.keys()) {
+    if (!activeIds.has(sessionId)) tilePacing.delete(sessionId);
+  }
+}
+
+function captureFrame(video, width, height) {
+  canvas.width = width;
+  canvas.height = height;
   ctx.drawImage(video, 0, 0, canvas.width, canvas.height);
-  const imageBase64 = canvas.toDataURL("image/jpeg", 0.75);
+  return canvas.toDataURL("image/jpeg", 0.75);
+}
+
+function renderResult(box, data) {
+  if (!data || data.error) {
+    box.textContent = `Sign: error (${data ? data.error : "missing result"})`;
+    return;
+  }
+
+  if (!data.ready) {
+    box.textContent = "Sign: collecting sequence...";
+    return;
+  }
+
+  const caption = `Sign: ${data.text || "..."} (${(data.confidence || 0).toFixed(2)})`;
+  const words = (data.transcript || "").split(" ").filter(Boolean);
+  box.textContent = words.length ? `${caption} | ${words.slice(-6).join(" ")}` : caption;
+}
+
+async function sendFrames(videos) {
+  const sentAt = Date.now();
+  const tiles = videos.map((video) => {
+    const sessionId = sessionIdFor(video);
+    const pacing = pacingFor(sessionId);
+    return {
+      video,
+      session_id: sessionId,
+      image_base64: captureFrame(video, pacing.width, pacing.height),
+    };
+  });
 
   const response = await chrome.runtime.sendMessage({
-    type: "predict",
-    payload: { session_id: SESSION_ID, image_base64: imageBase64 },
+    type: "predict_batch",
+    payload: {
+      tiles: tiles.map(({ session_id, image_base64 }) => ({ session_id, image_base64 })),
+      // An answer later than the tightest tile interval is stale; the server routes within it.
+      latency_budget_ms: Math.min(...tiles.map((tile) => pacingFor(tile.session_id).intervalMs)),
+    },
   });
 
   if (!response || !response.ok) {
@@ -45,34 +171,43 @@ async function sendFrame(video) {
 
   const data = response.data;
   if (data.error) {
-    overlay.textContent = `Sign: error (${data.error})`;
+    for (const tile of tiles) backOffPacing(tile.session_id, sentAt);
+    statusOverlay.textContent = `Sign: error (${data.error})`;
     return;
   }
 
-  if (!data.ready) {
-    overlay.textContent = "Sign: collecting sequence...";
-    return;
+  const results = new Map((data.results || []).map((r) => [r.session_id, r]));
+  for (const tile of tiles) {
+    const result = results.get(tile.session_id);
+    applyPacing(tile.session_id, result?.pacing, sentAt);
+    renderResult(tileOverlayFor(tile.session_id, tile.video), result);
   }
-
-  overlay.textContent = `Sign: ${data.text} (${(data.confidence || 0).toFixed(2)})`;
+  statusOverlay.textContent = `Sign: ${tiles.length} tile(s)`;
 }
 
 async function loop() {
   ensureOverlay();
-  const video = findActiveVideo();
-  if (!video) {
-    overlay.textContent = "Sign: no video found";
+  const videos = findVisibleVideos();
+  removeStaleOverlays(new Set(videos.map(sessionIdFor)));
+  if (!videos.length) {
+    statusOverlay.textContent = "Sign: no video found";
     setTimeout(loop, FRAME_INTERVAL_MS);
     return;
   }
 
-  try {
-    await sendFrame(video);
-  } catch (err) {
-    overlay.textContent = `Sign: API not reachable (${String(err).slice(0, 80)})`;
+  // Only tiles whose server-recommended interval has elapsed are sent this tick.
+  const now = Date.now();
+  const due = videos.filter((video) => pacingFor(sessionIdFor(video)).dueAt <= now);
+  if (due.length) {
+    try {
+      await sendFrames(due);
+    } catch (err) {
+      for (const video of due) backOffPacing(sessionIdFor(video), now);
+      statusOverlay.textContent = `Sign: API not reachable (${String(err).slice(0, 80)})`;
+    }
   }
 
-  setTimeout(loop, FRAME_INTERVAL_MS);
+  setTimeout(loop, nextTickDelay());
 }
 
 loop();
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+import os
+from pathlib import Path
+import queue
+import threading
+import time
+
+import numpy as np
+
+from main import BASE_URL, DownloadStats, SessionPool, download_one, iter_scraped_entries
+from sign_translator.dataset import parse_word_and_video_id
+from sign_translator.landmarks import SequenceSample, extract_sequence_from_video
+from sign_translator.manifest import CrawlManifest
+
+TARGET_DEFAULTS = {
+    # target: (output, sequence_len, max_frames, frame_size) -- same as prepare_dataset.py / build_sign_index.py
+    "dataset": ("processed/sign_dataset.npz", 30, 120, 32),
+    "index": ("models/sign_index.npz", 20, 40, 24),
+}
+
+_DONE = None
+
+
+def load_feature_store(path: Path) -> tuple[list[np.ndarray], list[str], list[str]]:
+    if not path.exists():
+        return [], [], []
+    data = np.load(path, allow_pickle=True)
+    return list(data["X"]), [str(v) for v in data["y"]], [str(v) for v in data["vid"]]
+
+
+def save_feature_store(path: Path, features: list[np.ndarray], labels: list[str], vid_ids: list[str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.stem}.tmp.npz")
+    np.savez_compressed(temp_path, X=np.stack(features, axis=0), y=np.array(labels), vid=np.array(vid_ids))
+    os.replace(temp_path, path)
+
+
+def scrape_stage(
+    download_queue: queue.Queue,
+    download_workers: int,
+    timeout: int,
+    retries: int,
+    base_url: str,
+    manifest: CrawlManifest | None,
+    max_entries: int,
+    known_vids: set[str],
+    skipped: list[str],
+    errors: list[str],
+) -> None:
+    """Queues scraped entries for download; videos already in the store are not re-fetched at all."""
+    seen = set(known_vids)
+    try:
+        for count, entry in enumerate(
+            iter_scraped_entries(timeout, retries, base_url=base_url, manifest=manifest), start=1
+        ):
+            if entry.vid_id in seen:
+                skipped.append(entry.vid_id)
+            else:
+                seen.add(entry.vid_id)
+                download_queue.put(entry)
+            if 0 < max_entries <= count:
+                break
+    except Exception as exc:
+        print(f"[scrape] stopped: {exc}")
+        errors.append(str(exc))
+    finally:
+        for _ in range(download_workers):
+            download_queue.put(_DONE)
+
+
+def download_stage(
+    download_queue: queue.Queue,
+    feature_queue: queue.Queue,
+    output_folder: str,
+    timeout: int,
+    retries: int,
+    sessions: SessionPool,
+    stats: DownloadStats,
+    manifest: CrawlManifest | None,
+    failures: list[str],
+) -> None:
+    while True:
+        entry = download_queue.get()
+        if entry is _DONE:
+            break
+        ok, filename, _ = download_one(
+            entry, output_folder, timeout, retries, session=sessions.get(), stats=stats, manifest=manifest
+        )
+        if ok:
+            feature_queue.put((entry, Path(output_folder) / filename))
+        else:
+            failures.append(entry.vid_id)
+
+
+def _finish_feature(
+    future: Future, labelled: tuple[str, str], samples: list[SequenceSample], failures: list[str]
+) -> None:
+    label, vid_id = labelled
+    try:
+        features = future.result()
+    except Exception as exc:
+        print(f"[features] FAIL {vid_id}: {exc}")
+        failures.append(vid_id)
+        return
+    samples.append(SequenceSample(label=label, vid_id=vid_id, features=features))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Scrape, download and featurize in one pipelined pass (appends to the feature store or sign index)"
+    )
+    parser.add_argument("--target", choices=sorted(TARGET_DEFAULTS), default="dataset")
+    parser.add_argument("--dataset", default="dataset1", help="Video download folder")
+    parser.add_argument("--output", default="", help="NPZ store to append to (default depends on --target)")
+    parser.add_argument("--sequence-len", type=int, default=0)
+    parser.add_argument("--max-frames", type=int, default=0)
+    parser.add_argument("--frame-size", type=int, default=0)
+    parser.add_argument("--download-workers", type=int, default=8)
+    parser.add_argument("--feature-workers", type=int, default=max(1, (os.cpu_count() or 2) - 1))
+    parser.add_argument("--queue-size", type=int, default=64, help="Bound of each inter-stage queue")
+    parser.add_argument("--timeout", type=int, default=30)
+    parser.add_argument("--retries", type=int, default=4)
+    parser.add_argument("--max-downloads", type=int, default=0, help="Stop after the first N scraped entries (0=all)")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--no-manifest", action="store_true")
+    args = parser.parse_args()
+
+    default_output, default_seq, default_frames, default_size = TARGET_DEFAULTS[args.target]
+    out_path = Path(args.output or default_output)
+    sequence_len = args.sequence_len or default_seq
+    max_frames = args.max_frames or default_frames
+    frame_size = args.frame_size or default_size
+
+    os.makedirs(args.dataset, exist_ok=True)
+    manifest = None if args.no_manifest else CrawlManifest.load(args.dataset)
+    features, labels, vid_ids = load_feature_store(out_path)
+    if features and features[0].shape != (sequence_len, frame_size * frame_size):
+        raise RuntimeError(
+            f"Existing store {out_path} has sample shape {features[0].shape}; "
+            f"expected {(sequence_len, frame_size * frame_size)}"
+        )
+    known_vids = set(vid_ids)
+    print(f"[ingest] target: {args.target} | store: {out_path} | existing samples: {len(known_vids)}")
+
+    download_workers = max(1, args.download_workers)
+    feature_workers = max(1, args.feature_workers)
+    download_queue: queue.Queue = queue.Queue(maxsize=max(1, args.queue_size))
+    feature_queue: queue.Queue = queue.Queue(maxsize=max(1, args.queue_size))
+    sessions = SessionPool()
+    stats = DownloadStats()
+    download_failures: list[str] = []
+    feature_failures: list[str] = []
+    samples: list[SequenceSample] = []
+    scrape_errors: list[str] = []
+    skipped: list[str] = []
+    started = time.monotonic()
+
+    scraper = threading.Thread(
+        target=scrape_stage,
+        args=(download_queue, download_workers, args.timeout, max(1, args.retries),
+              args.base_url.rstrip("/"), manifest, args.max_downloads, known_vids, skipped, scrape_errors),
+        daemon=True,
+    )
+    downloaders = [
+        threading.Thread(
+            target=download_stage,
+            args=(download_queue, feature_queue, args.dataset, args.timeout, max(1, args.retries),
+                  sessions, stats, manifest, download_failures),
+            daemon=True,
+        )
+        for _ in range(download_workers)
+    ]
+    scraper.start()
+    for thread in downloaders:
+        thread.start()
+
+    def close_feature_queue() -> None:
+        for thread in downloaders:
+            thread.join()
+        feature_queue.put(_DONE)
+
+    threading.Thread(target=close_feature_queue, daemon=True).start()
+
+    submitted = 0
+    try:
+        with ProcessPoolExecutor(max_workers=feature_workers) as executor:
+            in_flight: dict[Future, tuple[str, str]] = {}
+            while True:
+                item = feature_queue.get()
+                if item is _DONE:
+                    break
+                entry, video_path = item
+                # Same labels as a directory scan of the saved files (prepare_dataset.py).
+                try:
+                    labelled = parse_word_and_video_id(Path(video_path).stem)
+                except ValueError as exc:
+                    print(f"[features] SKIP {entry.vid_id}: {exc}")
+                    feature_failures.append(entry.vid_id)
+                    continue
+
+                # Keep CPU busy without letting finished-but-unread futures pile up.
+                while len(in_flight) >= feature_workers * 2:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        _finish_feature(future, in_flight.pop(future), samples, feature_failures)
+
+                future = executor.submit(extract_sequence_from_video, video_path, sequence_len, max_frames, frame_size)
+                in_flight[future] = labelled
+                submitted += 1
+
+                if submitted % 50 == 0:
+                    mb_per_s, files_per_s = stats.rates()
+                    print(
+                        f"[ingest] featurizing: {submitted} | done: {len(samples)} | "
+                        f"download: {mb_per_s:.2f} MB/s, {files_per_s:.1f} files/s"
+                    )
+
+            for future in list(in_flight):
+                _finish_feature(future, in_flight.pop(future), samples, feature_failures)
+    finally:
+        sessions.close()
+        if manifest is not None:
+            manifest.save()
+
+    scraper.join()
+    for sample in samples:
+        features.append(sample.features)
+        labels.append(sample.label)
+        vid_ids.append(sample.vid_id)
+
+    if samples:
+        save_feature_store(out_path, features, labels, vid_ids)
+
+    elapsed = time.monotonic() - started
+    print(f"[ingest] new samples: {len(samples)} | already in store: {len(skipped)}")
+    print(f"[ingest] failed downloads: {len(download_failures)} | failed features: {len(feature_failures)}")
+    if scrape_errors:
+        print(f"[ingest] scrape incomplete: {scrape_errors[0]}")
+    print(f"[ingest] store size: {len(vid_ids)} | elapsed: {elapsed:.1f}s")
+    if samples:
+        print(f"[saved] {out_path}")
+
+
+if __name__ == "__main__":
+    main()
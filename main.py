@@ -1,14 +1,19 @@
 import argparse
 import html
 import os
+import random
 import re
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from typing import Iterator
 from urllib.parse import urljoin
 
 import requests
 
+from sign_translator.manifest import CrawlManifest, ManifestPage, ManifestVideo
+
 BASE_URL = "https://tidsozluk.aile.gov.tr"
 ALPHABET = [
     "A", "B", "C", "Ç", "D", "E", "F", "G", "Ğ", "H", "I", "İ",
@@ -23,6 +28,9 @@ HEADERS = {
 
 CHUNK_SIZE = 512 * 1024
 MIN_FILE_SIZE = 4 * 1024
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 16.0
+MANIFEST_SAVE_EVERY = 100
 
 
 @dataclass
@@ -53,7 +61,7 @@ def extract_total_pages(page_html: str) -> int:
     return max(int(value) for value in matches)
 
 
-def parse_entries_from_html(page_html: str) -> list[VideoEntry]:
+def parse_entries_from_html(page_html: str, base_url: str = BASE_URL) -> list[VideoEntry]:
     item_pattern = re.compile(
         r'<div class="rezult_item row".*?</a></div>',
         re.DOTALL | re.IGNORECASE,
@@ -76,7 +84,7 @@ def parse_entries_from_html(page_html: str) -> list[VideoEntry]:
 
         sources = src_pattern.findall(block)
         for src in sources:
-            full_url = urljoin(BASE_URL, src)
+            full_url = urljoin(base_url, src)
             vid_match = re.search(r"/degiske/([^/_]+)_cr_0\.1\.mp4$", full_url)
             if not vid_match:
                 continue
@@ -86,131 +94,540 @@ def parse_entries_from_html(page_html: str) -> list[VideoEntry]:
     return entries
 
 
-def fetch_html(session: requests.Session, url: str, timeout: int, retries: int) -> str:
+class RateLimiter:
+    """Global request pacing shared by all crawl threads (max_rps <= 0 disables it)."""
+
+    def __init__(self, max_rps: float):
+        self.interval = 1.0 / max_rps if max_rps > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given (1-based) failed attempt."""
+    ceiling = min(BACKOFF_MAX, BACKOFF_BASE * (2 ** (attempt - 1)))
+    return random.uniform(0.0, ceiling)
+
+
+def fetch_response(
+    session: requests.Session,
+    url: str,
+    timeout: int,
+    retries: int,
+    limiter: RateLimiter | None = None,
+    headers: dict[str, str] | None = None,
+) -> requests.Response:
     last_error = None
     for attempt in range(1, retries + 1):
         try:
-            response = session.get(url, timeout=timeout)
+            if limiter is not None:
+                limiter.wait()
+            response = session.get(url, timeout=timeout, headers=headers)
             response.raise_for_status()
-            return response.text
+            return response
         except Exception as error:
             last_error = error
             if attempt < retries:
-                time.sleep(1.0)
+                time.sleep(backoff_delay(attempt))
     raise RuntimeError(f"HTML fetch failed: {url} ({last_error})")
 
 
-def scrape_all_entries(timeout: int, retries: int) -> list[VideoEntry]:
+def fetch_html(
+    session: requests.Session,
+    url: str,
+    timeout: int,
+    retries: int,
+    limiter: RateLimiter | None = None,
+) -> str:
+    return fetch_response(session, url, timeout, retries, limiter).text
+
+
+def conditional_headers(etag: str, last_modified: str) -> dict[str, str]:
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def fetch_page(
+    session: requests.Session,
+    url: str,
+    timeout: int,
+    retries: int,
+    limiter: RateLimiter | None = None,
+    manifest: CrawlManifest | None = None,
+    base_url: str = BASE_URL,
+) -> tuple[int, list[VideoEntry]]:
+    """
+    (total_pages, entries) for one result page. With a manifest, the page is
+    revalidated with If-None-Match/If-Modified-Since and a 304 reuses the stored entries.
+    """
+    cached = manifest.pages.get(url) if manifest is not None else None
+    headers = conditional_headers(cached.etag, cached.last_modified) if cached is not None else None
+
+    response = fetch_response(session, url, timeout, retries, limiter, headers=headers)
+    if response.status_code == 304 and cached is not None:
+        return cached.total_pages, [VideoEntry(**entry) for entry in cached.entries]
+
+    page_html = response.text
+    total_pages = extract_total_pages(page_html)
+    entries = parse_entries_from_html(page_html, base_url)
+    if manifest is not None:
+        manifest.set_page(
+            ManifestPage(
+                url=url,
+                etag=response.headers.get("ETag", ""),
+                last_modified=response.headers.get("Last-Modified", ""),
+                total_pages=total_pages,
+                entries=[asdict(entry) for entry in entries],
+            )
+        )
+    return total_pages, entries
+
+
+def letter_url(letter: str, base_url: str = BASE_URL) -> str:
+    return f"{base_url}/tr/Alfabetik/Arama/{letter}"
+
+
+def page_url(first_page_url: str, page_num: int) -> str:
+    return first_page_url if page_num == 1 else f"{first_page_url}?p={page_num}"
+
+
+def new_session() -> requests.Session:
     session = requests.Session()
     session.headers.update(HEADERS)
+    return session
+
+
+class SessionPool:
+    """One pooled requests.Session per worker thread, so connections are reused across tasks."""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions: list[requests.Session] = []
+
+    def get(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = new_session()
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self) -> None:
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+
+
+def iter_scraped_entries(
+    timeout: int,
+    retries: int,
+    base_url: str = BASE_URL,
+    manifest: CrawlManifest | None = None,
+) -> Iterator[VideoEntry]:
+    """Yield each new (vid_id-deduplicated) entry as soon as its result page is parsed."""
+    session = new_session()
+    seen_vid: set[str] = set()
+
+    try:
+        for index, letter in enumerate(ALPHABET, start=1):
+            first_page_url = letter_url(letter, base_url)
+            print(f"[{index}/{len(ALPHABET)}] Taraniyor: {letter}")
+
+            total_pages, first_entries = fetch_page(
+                session, first_page_url, timeout, retries, manifest=manifest, base_url=base_url
+            )
+            print(f"  Sayfa sayisi: {total_pages}")
+
+            letter_count = 0
+            for page_num in range(1, total_pages + 1):
+                url = page_url(first_page_url, page_num)
+                if page_num == 1:
+                    page_entries = first_entries
+                else:
+                    _, page_entries = fetch_page(session, url, timeout, retries, manifest=manifest, base_url=base_url)
+
+                for entry in page_entries:
+                    if entry.vid_id not in seen_vid:
+                        seen_vid.add(entry.vid_id)
+                        letter_count += 1
+                        yield entry
+
+            print(f"  Yeni video: {letter_count}")
+    finally:
+        session.close()
+
+
+def scrape_all_entries(
+    timeout: int,
+    retries: int,
+    base_url: str = BASE_URL,
+    manifest: CrawlManifest | None = None,
+) -> list[VideoEntry]:
+    all_entries = list(iter_scraped_entries(timeout, retries, base_url=base_url, manifest=manifest))
+    print(f"\nToplam benzersiz video: {len(all_entries)}")
+    return all_entries
 
-    seen_vid: dict[str, VideoEntry] = {}
-
-    for index, letter in enumerate(ALPHABET, start=1):
-        first_page_url = f"{BASE_URL}/tr/Alfabetik/Arama/{letter}"
-        print(f"[{index}/{len(ALPHABET)}] Taraniyor: {letter}")
 
-        first_html = fetch_html(session, first_page_url, timeout, retries)
-        total_pages = extract_total_pages(first_html)
-        print(f"  Sayfa sayisi: {total_pages}")
+def scrape_all_entries_concurrent(
+    timeout: int,
+    retries: int,
+    workers: int,
+    max_rps: float = 0.0,
+    base_url: str = BASE_URL,
+    manifest: CrawlManifest | None = None,
+) -> list[VideoEntry]:
+    """
+    Same result as scrape_all_entries, fetched over a bounded thread pool.
+    Page counts for all letters are discovered first, then every remaining page is
+    fetched in parallel; entries are merged in (letter, page) order so the output
+    does not depend on completion order.
+    """
+    limiter = RateLimiter(max_rps)
+    sessions = SessionPool()
+
+    def fetch(url: str) -> tuple[int, list[VideoEntry]]:
+        return fetch_page(sessions.get(), url, timeout, retries, limiter, manifest=manifest, base_url=base_url)
+
+    pages: dict[tuple[int, int], list[VideoEntry]] = {}
+    total_pages: dict[int, int] = {}
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            first_futures = {
+                executor.submit(fetch, letter_url(letter, base_url)): index
+                for index, letter in enumerate(ALPHABET)
+            }
+            for future in as_completed(first_futures):
+                index = first_futures[future]
+                total_pages[index], pages[(index, 1)] = future.result()
+            print(f"Sayfa sayilari bulundu: {sum(total_pages.values())} sayfa / {len(ALPHABET)} harf")
+
+            page_futures = {}
+            for index, letter in enumerate(ALPHABET):
+                first_page_url = letter_url(letter, base_url)
+                for page_num in range(2, total_pages[index] + 1):
+                    future = executor.submit(fetch, page_url(first_page_url, page_num))
+                    page_futures[future] = (index, page_num)
+
+            for done, future in enumerate(as_completed(page_futures), start=1):
+                _, pages[page_futures[future]] = future.result()
+                if done % 50 == 0 or done == len(page_futures):
+                    print(f"  Sayfa: {done}/{len(page_futures)}")
+    finally:
+        sessions.close()
 
+    seen_vid: dict[str, VideoEntry] = {}
+    for index, letter in enumerate(ALPHABET):
         letter_count = 0
-        for page_num in range(1, total_pages + 1):
-            page_url = first_page_url if page_num == 1 else f"{first_page_url}?p={page_num}"
-            page_html = first_html if page_num == 1 else fetch_html(session, page_url, timeout, retries)
-            page_entries = parse_entries_from_html(page_html)
-
-            for entry in page_entries:
+        for page_num in range(1, total_pages[index] + 1):
+            for entry in pages[(index, page_num)]:
                 if entry.vid_id not in seen_vid:
                     seen_vid[entry.vid_id] = entry
                     letter_count += 1
+        print(f"[{index + 1}/{len(ALPHABET)}] {letter}: {total_pages[index]} sayfa | yeni video: {letter_count}")
 
-        print(f"  Yeni video: {letter_count}")
-
-    session.close()
     all_entries = list(seen_vid.values())
     print(f"\nToplam benzersiz video: {len(all_entries)}")
     return all_entries
 
 
-def download_one(entry: VideoEntry, output_folder: str, timeout: int, retries: int) -> tuple[bool, str, int]:
-    safe_word = sanitize_filename(entry.word)
-    filename = f"{safe_word}_{entry.vid_id}.mp4"
+class DownloadStats:
+    """Thread-safe byte/file counters for live throughput reporting."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.monotonic()
+        self.bytes = 0
+        self.files = 0
+
+    def add_bytes(self, count: int) -> None:
+        with self._lock:
+            self.bytes += count
+
+    def add_file(self) -> None:
+        with self._lock:
+            self.files += 1
+
+    def rates(self) -> tuple[float, float]:
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        return self.bytes / (1024 * 1024) / elapsed, self.files / elapsed
+
+
+def parse_total_size(response: requests.Response, offset: int) -> int | None:
+    """Full file size from Content-Range (206) or Content-Length (200), if the server sent it."""
+    content_range = response.headers.get("Content-Range", "")
+    match = re.match(r"bytes\s+(?:\d+-\d+|\*)/(\d+)", content_range)
+    if match:
+        return int(match.group(1))
+    content_length = response.headers.get("Content-Length")
+    if content_length and content_length.isdigit():
+        return offset + int(content_length)
+    return None
+
+
+def unsatisfied_range_size(response: requests.Response) -> int | None:
+    """Full file size from a 416's 'Content-Range: bytes */N' (its Content-Length is the error body's)."""
+    match = re.match(r"bytes\s+\*/(\d+)", response.headers.get("Content-Range", ""))
+    return int(match.group(1)) if match else None
+
+
+def read_part_validator(temp_path: str) -> tuple[str, str]:
+    """(ETag, Last-Modified) of the response a .part file was started from."""
+    try:
+        with open(f"{temp_path}.validator", "r", encoding="utf-8") as file_obj:
+            lines = file_obj.read().splitlines()
+    except OSError:
+        return "", ""
+    etag, last_modified = (lines + ["", ""])[:2]
+    return etag, last_modified
+
+
+def write_part_validator(temp_path: str, etag: str, last_modified: str) -> None:
+    with open(f"{temp_path}.validator", "w", encoding="utf-8") as file_obj:
+        file_obj.write(f"{etag}\n{last_modified}\n")
+
+
+def remove_part(temp_path: str) -> None:
+    for path in (temp_path, f"{temp_path}.validator"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def if_range_value(etag: str, last_modified: str) -> str:
+    """If-Range only accepts a strong ETag or a date; weak ETags fall back to Last-Modified."""
+    if etag and not etag.startswith("W/"):
+        return etag
+    return last_modified
+
+
+def video_filename(entry: VideoEntry) -> str:
+    return f"{sanitize_filename(entry.word)}_{entry.vid_id}.mp4"
+
+
+def is_known_good(entry: VideoEntry, known: ManifestVideo | None, existing_files: set[str]) -> bool:
+    """Manifest says this exact URL was fully downloaded and the file is still in the folder."""
+    return (
+        known is not None
+        and known.url == entry.url
+        and known.size >= MIN_FILE_SIZE
+        and known.path == video_filename(entry)
+        and known.path in existing_files
+    )
+
+
+def download_one(
+    entry: VideoEntry,
+    output_folder: str,
+    timeout: int,
+    retries: int,
+    session: requests.Session | None = None,
+    stats: DownloadStats | None = None,
+    manifest: CrawlManifest | None = None,
+) -> tuple[bool, str, int]:
+    filename = video_filename(entry)
     output_path = os.path.join(output_folder, filename)
     temp_path = f"{output_path}.part"
 
-    if os.path.exists(output_path) and os.path.getsize(output_path) >= MIN_FILE_SIZE:
-        return True, filename, os.path.getsize(output_path)
+    known = manifest.videos.get(entry.vid_id) if manifest is not None else None
+    revalidate = (
+        known is not None
+        and known.path == filename
+        and bool(known.etag or known.last_modified)
+        and os.path.exists(output_path)
+    )
 
-    headers = dict(HEADERS)
+    def record(size: int, etag: str = "", last_modified: str = "") -> None:
+        if manifest is not None:
+            manifest.set_video(
+                ManifestVideo(
+                    vid_id=entry.vid_id,
+                    word=entry.word,
+                    url=entry.url,
+                    path=filename,
+                    size=size,
+                    etag=etag,
+                    last_modified=last_modified,
+                )
+            )
+
+    if not revalidate and os.path.exists(output_path) and os.path.getsize(output_path) >= MIN_FILE_SIZE:
+        size = os.path.getsize(output_path)
+        record(size)
+        return True, filename, size
+
+    http = session or requests
     last_error = None
 
     for attempt in range(1, retries + 1):
         try:
-            with requests.get(entry.url, headers=headers, timeout=timeout, stream=True) as response:
-                response.raise_for_status()
-
-                downloaded = 0
-                with open(temp_path, "wb") as file_obj:
-                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
-                        if not chunk:
-                            continue
-                        file_obj.write(chunk)
-                        downloaded += len(chunk)
-
-            if downloaded < MIN_FILE_SIZE:
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
+            headers = dict(HEADERS)
+            offset = os.path.getsize(temp_path) if os.path.exists(temp_path) else 0
+            part_etag, part_last_modified = read_part_validator(temp_path) if offset > 0 else ("", "")
+            validator = if_range_value(part_etag, part_last_modified)
+            if offset > 0 and validator:
+                # If the file changed since the .part was started the server answers 200 with the
+                # whole new file instead of appending new bytes to old ones.
+                headers["Range"] = f"bytes={offset}-"
+                headers["If-Range"] = validator
+            elif offset > 0:
+                offset = 0
+            if offset == 0 and revalidate:
+                headers.update(conditional_headers(known.etag, known.last_modified))
+            etag = ""
+            last_modified = ""
+
+            with http.get(entry.url, headers=headers, timeout=timeout, stream=True) as response:
+                if response.status_code == 304 and revalidate:
+                    record(known.size, known.etag, known.last_modified)
+                    return True, filename, known.size
+                if response.status_code == 416 and offset > 0:
+                    # Range starts at/after EOF: the partial file is either complete or stale.
+                    expected = unsatisfied_range_size(response)
+                    if expected != offset:
+                        remove_part(temp_path)
+                        raise RuntimeError("range not satisfiable, restarting")
+                    etag, last_modified = part_etag, part_last_modified
+                else:
+                    response.raise_for_status()
+                    if response.status_code != 206:
+                        offset = 0
+                    expected = parse_total_size(response, offset)
+                    etag = response.headers.get("ETag", "") or (part_etag if offset > 0 else "")
+                    last_modified = response.headers.get("Last-Modified", "") or (
+                        part_last_modified if offset > 0 else ""
+                    )
+                    if offset == 0:
+                        write_part_validator(temp_path, etag, last_modified)
+
+                    with open(temp_path, "ab" if offset > 0 else "wb") as file_obj:
+                        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                            if not chunk:
+                                continue
+                            file_obj.write(chunk)
+                            if stats is not None:
+                                stats.add_bytes(len(chunk))
+
+            size = os.path.getsize(temp_path)
+            if expected is not None and size != expected:
+                if size > expected:
+                    remove_part(temp_path)
+                raise RuntimeError(f"size mismatch ({size}/{expected} bytes)")
+
+            if size < MIN_FILE_SIZE:
+                remove_part(temp_path)
                 last_error = RuntimeError("file too small")
                 if attempt < retries:
-                    time.sleep(0.8)
+                    time.sleep(backoff_delay(attempt))
                     continue
                 return False, filename, 0
 
             os.replace(temp_path, output_path)
-            return True, filename, downloaded
+            remove_part(temp_path)
+            record(size, etag, last_modified)
+            if stats is not None:
+                stats.add_file()
+            return True, filename, size
         except Exception as error:
+            # Keep the .part file so the next attempt (or next run) resumes with a Range request.
             last_error = error
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
             if attempt < retries:
-                time.sleep(1.0)
+                time.sleep(backoff_delay(attempt))
 
     print(f"  Hata ({entry.vid_id}): {last_error}")
     return False, filename, 0
 
 
-def download_all(entries: list[VideoEntry], output_folder: str, workers: int, timeout: int, retries: int) -> None:
+def download_all(
+    entries: list[VideoEntry],
+    output_folder: str,
+    workers: int,
+    timeout: int,
+    retries: int,
+    manifest: CrawlManifest | None = None,
+    revalidate: bool = False,
+) -> None:
     os.makedirs(output_folder, exist_ok=True)
 
     success = 0
     failed = 0
     total_bytes = 0
-
-    print(f"\nIndirme basliyor: {len(entries)} video | worker={workers}\n")
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        future_map = {
-            executor.submit(download_one, entry, output_folder, timeout, retries): entry
-            for entry in entries
-        }
-
-        for index, future in enumerate(as_completed(future_map), start=1):
-            ok, filename, size = future.result()
-            if ok:
+    sessions = SessionPool()
+    stats = DownloadStats()
+
+    skipped = 0
+    if manifest is not None and not revalidate:
+        # One directory listing instead of a stat per file.
+        existing_files = set(os.listdir(output_folder))
+        pending = []
+        for entry in entries:
+            known = manifest.videos.get(entry.vid_id)
+            if is_known_good(entry, known, existing_files):
+                skipped += 1
                 success += 1
-                total_bytes += size
-                print(f"[{index}/{len(entries)}] OK   {filename}")
+                total_bytes += known.size
             else:
-                failed += 1
-                print(f"[{index}/{len(entries)}] FAIL {filename}")
-
+                pending.append(entry)
+        print(f"\nManifest: {skipped} dosya guncel, atlandi")
+    else:
+        pending = list(entries)
+
+    def task(entry: VideoEntry) -> tuple[bool, str, int]:
+        return download_one(
+            entry, output_folder, timeout, retries, session=sessions.get(), stats=stats, manifest=manifest
+        )
+
+    print(f"\nIndirme basliyor: {len(pending)} video | worker={workers}\n")
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_map = {executor.submit(task, entry): entry for entry in pending}
+
+            for index, future in enumerate(as_completed(future_map), start=1):
+                if manifest is not None and index % MANIFEST_SAVE_EVERY == 0:
+                    manifest.save()
+                ok, filename, size = future.result()
+                mb_per_s, files_per_s = stats.rates()
+                rate = f"{mb_per_s:.2f} MB/s, {files_per_s:.1f} dosya/s"
+                if ok:
+                    success += 1
+                    total_bytes += size
+                    print(f"[{index}/{len(pending)}] OK   {filename} | {rate}")
+                else:
+                    failed += 1
+                    print(f"[{index}/{len(pending)}] FAIL {filename} | {rate}")
+    finally:
+        sessions.close()
+        if manifest is not None:
+            manifest.save()
+
+    mb_per_s, files_per_s = stats.rates()
     print("\n" + "=" * 70)
     print("INDIRME OZETI")
     print("=" * 70)
     print(f"Basarili : {success}")
     print(f"Hatali   : {failed}")
     print(f"Toplam   : {len(entries)}")
+    print(f"Atlanan  : {skipped}")
     print(f"Boyut    : {total_bytes / (1024 * 1024):.2f} MB")
+    print(f"Aktarilan: {stats.bytes / (1024 * 1024):.2f} MB")
+    print(f"Hiz      : {mb_per_s:.2f} MB/s | {files_per_s:.1f} dosya/s")
     print(f"Klasor   : {os.path.abspath(output_folder)}")
     print("=" * 70)
 
@@ -224,6 +641,15 @@ def build_arg_parser() -> argparse.ArgumentParser:
     parser.add_argument("--timeout", type=int, default=30, help="HTTP timeout (sn)")
     parser.add_argument("--retries", type=int, default=4, help="Yeniden deneme")
     parser.add_argument("--max-downloads", type=int, default=0, help="Test icin ilk N videoyu indir (0=tumu)")
+    parser.add_argument("--crawl-workers", type=int, default=0, help="Paralel sayfa tarama sayisi (0=sirali tarama)")
+    parser.add_argument("--max-rps", type=float, default=4.0, help="Paralel taramada saniyedeki en fazla istek (0=sinirsiz)")
+    parser.add_argument("--base-url", default=BASE_URL, help="Sozluk kok adresi (yerel test sunucusu icin)")
+    parser.add_argument("--no-manifest", action="store_true", help="manifest.json okuma/yazma kapali (her sey bastan)")
+    parser.add_argument(
+        "--revalidate",
+        action="store_true",
+        help="Manifestte guncel gorunen dosyalari da kosullu istekle (ETag/Last-Modified) dogrula",
+    )
     return parser
 
 
@@ -235,7 +661,26 @@ def main() -> None:
     print("(kelime_mapping.json kullanilmaz)")
     print("=" * 70)
 
-    entries = scrape_all_entries(timeout=args.timeout, retries=args.retries)
+    base_url = args.base_url.rstrip("/")
+    manifest = None if args.no_manifest else CrawlManifest.load(args.output)
+    if manifest is not None:
+        print(f"Manifest: {len(manifest.videos)} video, {len(manifest.pages)} sayfa kayitli")
+
+    if args.crawl_workers > 0:
+        entries = scrape_all_entries_concurrent(
+            timeout=args.timeout,
+            retries=max(1, args.retries),
+            workers=args.crawl_workers,
+            max_rps=args.max_rps,
+            base_url=base_url,
+            manifest=manifest,
+        )
+    else:
+        entries = scrape_all_entries(
+            timeout=args.timeout, retries=args.retries, base_url=base_url, manifest=manifest
+        )
+    if manifest is not None:
+        manifest.save()
     if not entries:
         print("Hic video bulunamadi.")
         return
@@ -250,6 +695,8 @@ def main() -> None:
         workers=max(1, args.workers),
         timeout=args.timeout,
         retries=max(1, args.retries),
+        manifest=manifest,
+        revalidate=args.revalidate,
     )
 
 
@@ -1,58 +1,192 @@
 from __future__ import annotations
 
+import time
+
+_MODULE_STARTED = time.perf_counter()
+
 import argparse
 import base64
-from collections import Counter
-from collections import defaultdict, deque
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 import importlib
 import os
 from pathlib import Path
+import threading
+from typing import TYPE_CHECKING
 
-import cv2
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 import numpy as np
 from pydantic import BaseModel
-import requests
 import uvicorn
 
-try:
-    InferenceHTTPClient = importlib.import_module("inference_sdk").InferenceHTTPClient
-except Exception:
-    class InferenceHTTPClient:
-        def __init__(self, api_url: str, api_key: str):
-            self.api_url = api_url.rstrip("/")
-            self.api_key = api_key
-
-        def infer(self, image_input, model_id: str) -> dict:
-            model_key = model_id.strip().strip("/")
-
-            if isinstance(image_input, np.ndarray):
-                ok, encoded = cv2.imencode(".jpg", image_input, [int(cv2.IMWRITE_JPEG_QUALITY), 85])
-                if not ok:
-                    raise ValueError("Image encoding failed")
-                image_bytes = encoded.tobytes()
-            elif isinstance(image_input, (str, Path)):
-                image_bytes = Path(image_input).read_bytes()
-            elif isinstance(image_input, (bytes, bytearray)):
-                image_bytes = bytes(image_input)
-            else:
-                raise TypeError("Unsupported input type for infer")
-
-            response = requests.post(
-                f"{self.api_url}/{model_key}",
-                params={"api_key": self.api_key},
-                files={"file": ("frame.jpg", image_bytes, "image/jpeg")},
-                timeout=15,
-            )
-            if response.status_code >= 400:
-                raise RuntimeError(f"Roboflow HTTP {response.status_code}: {response.text[:200]}")
-            return response.json()
+from sign_translator.backends import (
+    Backend,
+    BackendRouter,
+    ClassifierBackend,
+    RoboflowBackend,
+    SignIndexBackend,
+)
+from sign_translator.decoder import TemporalDecoder
+
+if TYPE_CHECKING:
+    from sign_translator.frames import FramePayload, RoiTracker
+
+# cv2, requests and inference_sdk are imported lazily (on first use / during background
+# loading) so the server can bind its socket before the heavy backend libraries load.
+
+
+class HTTPInferenceClient:
+    """Minimal stand-in for inference_sdk.InferenceHTTPClient (Python 3.13+ or SDK missing)."""
+
+    def __init__(self, api_url: str, api_key: str, max_concurrent_requests: int = 8):
+        import requests
+
+        self.api_url = api_url.rstrip("/")
+        self.api_key = api_key
+        self.max_concurrent_requests = max_concurrent_requests
+        self.session = requests.Session()
+
+    def infer(self, image_input, model_id: str):
+        if isinstance(image_input, list):
+            # Same contract as inference_sdk: a list in, a list of results out.
+            if len(image_input) <= 1:
+                return [self.infer(image, model_id) for image in image_input]
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrent_requests, len(image_input))) as executor:
+                return list(executor.map(lambda image: self.infer(image, model_id), image_input))
+
+        model_key = model_id.strip().strip("/")
+
+        if isinstance(image_input, np.ndarray):
+            import cv2
+
+            ok, encoded = cv2.imencode(".jpg", image_input, [int(cv2.IMWRITE_JPEG_QUALITY), 85])
+            if not ok:
+                raise ValueError("Image encoding failed")
+            image_bytes = encoded.tobytes()
+        elif isinstance(image_input, Path) or (isinstance(image_input, str) and os.path.exists(image_input)):
+            image_bytes = Path(image_input).read_bytes()
+        elif isinstance(image_input, str):
+            # Like inference_sdk, any other string is a base64-encoded image and is sent as-is.
+            image_bytes = base64.b64decode(image_input.split(",")[-1])
+        elif isinstance(image_input, (bytes, bytearray)):
+            image_bytes = bytes(image_input)
+        else:
+            raise TypeError("Unsupported input type for infer")
+
+        response = self.session.post(
+            f"{self.api_url}/{model_key}",
+            params={"api_key": self.api_key},
+            files={"file": ("frame.jpg", image_bytes, "image/jpeg")},
+            timeout=15,
+        )
+        if response.status_code >= 400:
+            raise RuntimeError(f"Roboflow HTTP {response.status_code}: {response.text[:200]}")
+        return response.json()
+
+
+def make_inference_client(api_url: str, api_key: str, max_concurrent_requests: int = 8):
+    try:
+        sdk = importlib.import_module("inference_sdk")
+    except Exception:
+        return HTTPInferenceClient(api_url=api_url, api_key=api_key, max_concurrent_requests=max_concurrent_requests)
+    client = sdk.InferenceHTTPClient(api_url=api_url, api_key=api_key)
+    # The SDK default (1) sends the images of a batched infer() one after another.
+    client.configure(sdk.InferenceConfiguration(max_concurrent_requests=max_concurrent_requests))
+    return client
+
+
+class StartupTimer:
+    """Wall time of each named startup phase, reported on /ready and in the log."""
+
+    def __init__(self):
+        self.phases: dict[str, float] = {}
+        self.phase = "starting"
+        self.error = ""
+
+    def run(self, name: str, fn):
+        self.phase = name
+        started = time.perf_counter()
+        try:
+            return fn()
+        finally:
+            self.phases[name] = round(time.perf_counter() - started, 4)
+            print(f"[startup] {name}: {self.phases[name]:.3f}s")
 
 
 class PredictRequest(BaseModel):
     session_id: str
     image_base64: str
+    latency_budget_ms: float | None = None
+
+
+class BatchPredictRequest(BaseModel):
+    tiles: list[PredictRequest]
+    latency_budget_ms: float | None = None
+
+
+class FramePacer:
+    """
+    Recommends the client's next frame interval and capture size from server load
+    (in-flight tiles, latency EWMA) and the session's motion level.
+    """
+
+    RESOLUTIONS = [(320, 240), (240, 180), (160, 120)]
+
+    def __init__(
+        self,
+        base_interval_ms: int = 500,
+        min_interval_ms: int = 250,
+        max_interval_ms: int = 3000,
+        target_latency_ms: float = 400.0,
+        max_inflight: int = 8,
+        still_motion: float = 2.0,
+        busy_motion: float = 10.0,
+    ):
+        self.base_interval_ms = base_interval_ms
+        self.min_interval_ms = min_interval_ms
+        self.max_interval_ms = max_interval_ms
+        self.target_latency_ms = target_latency_ms
+        self.max_inflight = max_inflight
+        self.still_motion = still_motion
+        self.busy_motion = busy_motion
+        self.inflight = 0
+        self.latency_ms = 0.0
+        self._lock = threading.Lock()
+
+    def begin(self, tiles: int = 1) -> float:
+        with self._lock:
+            self.inflight += tiles
+        return time.perf_counter()
+
+    def end(self, started: float, tiles: int = 1) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        with self._lock:
+            self.inflight = max(0, self.inflight - tiles)
+            self.latency_ms = elapsed_ms if self.latency_ms == 0.0 else 0.8 * self.latency_ms + 0.2 * elapsed_ms
+
+    def load(self) -> float:
+        with self._lock:
+            return max(self.inflight / self.max_inflight, self.latency_ms / self.target_latency_ms)
+
+    def recommend(self, motion: float | None) -> dict:
+        load = self.load()
+        interval = self.base_interval_ms * max(1.0, load)
+        if motion is not None:
+            if motion < self.still_motion:
+                interval *= 2.0
+            elif motion > self.busy_motion:
+                interval *= 0.75
+        interval = min(self.max_interval_ms, max(self.min_interval_ms, interval))
+
+        level = 0 if load <= 1.5 else 1 if load <= 3.0 else 2
+        width, height = self.RESOLUTIONS[level]
+        return {"next_interval_ms": int(interval), "width": width, "height": height, "load": round(load, 2)}
+
+
+BACKEND_TYPES = ("roboflow", "classifier", "index")
 
 
 class ModelRuntime:
@@ -63,25 +197,122 @@ class ModelRuntime:
         api_url: str = "https://serverless.roboflow.com",
         min_confidence: float = 0.35,
         dataset_path: str = "dataset1",
+        decoder_alpha: float = 0.6,
+        emit_threshold: float = 0.5,
+        release_threshold: float = 0.2,
+        backends: list[str] | None = None,
+        classifier_path: str = "models/sign_classifier.joblib",
+        index_path: str = "models/sign_index.npz",
+        latency_budget_ms: float = 800.0,
+        hedge_percentile: float = 95.0,
+        max_remote_inflight: int = 16,
+        roi_crop: bool = False,
+        session_ttl_s: float = 300.0,
+        max_sessions: int = 256,
+        defer_load: bool = False,
     ):
-        if not api_key:
+        self.backend_names = list(backends or ["roboflow"])
+        unknown = set(self.backend_names) - set(BACKEND_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown backend(s) {sorted(unknown)}; choose from {', '.join(BACKEND_TYPES)}")
+        if "roboflow" in self.backend_names and not api_key:
             raise ValueError("Roboflow API key not set. Use --api-key or ROBOFLOW_API_KEY environment variable.")
 
-        self.mode = "roboflow"
+        self.mode = "+".join(self.backend_names)
         self.api_key = api_key
         self.model_id = model_id.strip().strip("/")
         self.api_url = api_url.rstrip("/")
         self.min_confidence = float(min_confidence)
-        self.client = InferenceHTTPClient(api_url=self.api_url, api_key=self.api_key)
+        self.classifier_path = classifier_path
+        self.index_path = index_path
+        self.latency_budget_ms = float(latency_budget_ms)
+        self.hedge_percentile = float(hedge_percentile)
+        self.max_remote_inflight = int(max_remote_inflight)
+        self.router: BackendRouter | None = None
+        self.gray_side = 0
 
         self.dataset_path = Path(dataset_path)
+        self.dataset_exists = False
+        self.dataset_labels: list[str] = []
+        self.dataset_label_keys: set[str] = set()
+        self.startup = StartupTimer()
+        self.ready = False
+
+        self.decoder_alpha = float(decoder_alpha)
+        self.emit_threshold = float(emit_threshold)
+        self.release_threshold = float(release_threshold)
+        self.decoders: dict[str, TemporalDecoder] = defaultdict(self.new_decoder)
+        self.pacer = FramePacer()
+        self.motion: dict[str, float] = {}
+        self.motion_thumbs: dict[str, np.ndarray] = {}
+        self.roi_crop = roi_crop
+        self.roi_trackers: dict[str, RoiTracker] = {}
+        # Tiles come and go with every meeting and nothing deletes their sessions, so idle
+        # ones are evicted after session_ttl_s and the least recently seen beyond max_sessions.
+        self.session_ttl_s = float(session_ttl_s)
+        self.max_sessions = int(max_sessions)
+        self.last_seen: dict[str, float] = {}
+        self._sessions_lock = threading.Lock()
+        self._next_sweep = 0.0
+
+        if not defer_load:
+            self.load()
+
+    def load(self) -> None:
+        """Backends and dataset labels; the slow part of startup, timed per phase."""
+        backends = [
+            self.startup.run(f"backend_{name}", lambda name=name: self.make_backend(name))
+            for name in self.backend_names
+        ]
+        # Largest grayscale view a local backend reads; the motion thumbnail shares that decode.
+        self.gray_side = max((getattr(backend, "frame_size", 0) for backend in backends), default=0)
+        self.router = BackendRouter(
+            backends,
+            default_budget_ms=self.latency_budget_ms,
+            hedge_percentile=self.hedge_percentile,
+        )
+        self.startup.run("dataset_labels", self._load_labels)
+
+    def make_backend(self, name: str) -> Backend:
+        if name == "roboflow":
+            return RoboflowBackend(
+                lambda: make_inference_client(self.api_url, self.api_key),
+                self.model_id,
+                max_inflight=self.max_remote_inflight,
+            )
+        if name == "classifier":
+            return ClassifierBackend(self.classifier_path)
+        return SignIndexBackend(self.index_path)
+
+    def _load_labels(self) -> None:
         self.dataset_exists = self.dataset_path.exists()
         self.dataset_labels = self.load_dataset_labels()
         self.dataset_label_keys = {self.normalize_label(label) for label in self.dataset_labels}
 
-        self.sequence_len = 4
-        self.pred_history: dict[str, deque[str]] = defaultdict(lambda: deque(maxlen=5))
-        self.buffers: dict[str, deque[np.ndarray]] = defaultdict(lambda: deque(maxlen=self.sequence_len))
+    def warm_up(self, run_inference: bool = True) -> None:
+        """Prime the JPEG decoder, the motion path and the backend connection before real traffic."""
+        import cv2
+
+        probe = np.zeros((240, 320, 3), dtype=np.uint8)
+        cv2.putText(probe, "warmup", (40, 120), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2)
+        ok, encoded = cv2.imencode(".jpg", probe)
+        if not ok:
+            raise ValueError("Image encoding failed")
+        image_base64 = base64.b64encode(encoded.tobytes()).decode("ascii")
+
+        def decode() -> FramePayload:
+            frame = self.prepare_frame("__warmup__", image_base64)
+            self.update_motion("__warmup__", frame)
+            # Reduced-scale and full-resolution decode paths.
+            frame.gray(32)
+            frame.color()
+            return frame
+
+        frame = self.startup.run("warmup_decode", decode)
+        if run_inference:
+            # Failed warm-up calls are logged by the router and must not keep the instance out of rotation.
+            self.startup.run("warmup_inference", lambda: self.router.warm_up(("__warmup__", frame)))
+        self.reset_session("__warmup__")
 
     @staticmethod
     def normalize_label(text: str) -> str:
@@ -119,17 +350,22 @@ class ModelRuntime:
                 labels.add(cleaned)
         return sorted(labels)
 
-    def decode_image(self, image_base64: str) -> np.ndarray:
-        data = image_base64.split(",")[-1]
-        binary = base64.b64decode(data)
-        arr = np.frombuffer(binary, dtype=np.uint8)
-        img = cv2.imdecode(arr, cv2.IMREAD_COLOR)
-        if img is None:
-            raise ValueError("Invalid image data")
-        return img
+    def decode_image(self, image_base64: str) -> FramePayload:
+        """
+        Wraps the client's JPEG; only the grayscale thumbnail is decoded here.
+        Backends decode the view they need (see FramePayload) or send the JPEG on unchanged.
+        """
+        from sign_translator.frames import FramePayload
+
+        frame = FramePayload(image_base64, gray_side=self.gray_side)
+        frame.thumbnail()
+        return frame
 
-    def infer_roboflow(self, img: np.ndarray) -> dict:
-        return self.client.infer(img, model_id=self.model_id)
+    def infer(
+        self, tiles: list[tuple[str, FramePayload]], budget_ms: float | None = None
+    ) -> list[tuple[str, dict] | Exception | None]:
+        """Per (session_id, frame) tile: (backend name, result), its call's error, or None if not ready yet."""
+        return self.router.infer_batch(tiles, budget_ms)
 
     @staticmethod
     def pick_best_prediction(result: dict) -> tuple[str, float]:
@@ -158,36 +394,189 @@ class ModelRuntime:
 
         return "", 0.0
 
-    def predict(self, session_id: str, image_base64: str) -> dict:
+    def update_motion(self, session_id: str, frame: FramePayload) -> None:
+        """
+        EWMA of mean absolute difference between consecutive 32x24 grayscale thumbnails.
+        With ROI cropping on, the same difference image moves the session's crop box.
+        """
+        import cv2
+
+        thumb = cv2.resize(frame.thumbnail(), (32, 24), interpolation=cv2.INTER_AREA)
+        prev = self.motion_thumbs.get(session_id)
+        self.motion_thumbs[session_id] = thumb
+        if prev is None:
+            return
+        diff = cv2.absdiff(thumb, prev)
+        last = self.motion.get(session_id)
+        level = float(diff.mean())
+        self.motion[session_id] = level if last is None else 0.6 * last + 0.4 * level
+        if self.roi_crop:
+            from sign_translator.frames import RoiTracker
+
+            frame.roi = self.roi_trackers.setdefault(session_id, RoiTracker()).update(diff)
+
+    def new_decoder(self) -> TemporalDecoder:
+        return TemporalDecoder(
+            alpha=self.decoder_alpha,
+            emit_threshold=self.emit_threshold,
+            release_threshold=self.release_threshold,
+        )
+
+    def transcript(self, session_id: str) -> list[str]:
+        decoder = self.decoders.get(session_id)
+        return list(decoder.transcript) if decoder is not None else []
+
+    def touch_session(self, session_id: str) -> None:
+        """Marks the session as active and evicts idle or excess sessions."""
+        now = time.monotonic()
+        evict: set[str] = set()
+        with self._sessions_lock:
+            self.last_seen[session_id] = now
+            if now >= self._next_sweep:
+                self._next_sweep = now + min(10.0, self.session_ttl_s / 4)
+                evict = {sid for sid, seen in self.last_seen.items() if now - seen > self.session_ttl_s}
+                if evict:
+                    print(f"[sessions] evicted {len(evict)} idle session(s)")
+            excess = len(self.last_seen) - len(evict) - self.max_sessions
+            if excess > 0:
+                oldest = sorted((sid for sid in self.last_seen if sid not in evict), key=self.last_seen.get)
+                evict.update(oldest[:excess])
+        for sid in evict:
+            self.reset_session(sid)
+
+    def reset_session(self, session_id: str) -> None:
+        with self._sessions_lock:
+            self.last_seen.pop(session_id, None)
+        self.decoders.pop(session_id, None)
+        self.motion.pop(session_id, None)
+        self.motion_thumbs.pop(session_id, None)
+        self.roi_trackers.pop(session_id, None)
+        if self.router is not None:
+            self.router.reset_session(session_id)
+
+    def pacing(self, session_id: str) -> dict:
+        return self.pacer.recommend(self.motion.get(session_id))
+
+    def prepare_frame(self, session_id: str, image_base64: str) -> FramePayload:
+        self.touch_session(session_id)
         frame = self.decode_image(image_base64)
-
-        buf = self.buffers[session_id]
-        buf.append(frame)
-
-        if len(buf) < self.sequence_len:
-            return {"text": "", "confidence": 0.0, "ready": False}
-
-        result = self.infer_roboflow(buf[-1])
+        self.update_motion(session_id, frame)
+        self.router.observe(session_id, frame)
+        return frame
+
+    def finish_prediction(self, session_id: str, outcome: tuple[str, dict] | Exception | None) -> dict:
+        if isinstance(outcome, Exception):
+            raise outcome
+        if outcome is None:
+            # Only sequence backends are configured and this session's window is still filling.
+            return {
+                "text": "",
+                "confidence": 0.0,
+                "emitted": "",
+                "transcript": " ".join(self.transcript(session_id)),
+                "ready": False,
+                "source": None,
+                "dataset1_found": self.dataset_exists,
+                "dataset1_labels_count": len(self.dataset_labels),
+            }
+        source, result = outcome
         text, confidence = self.pick_best_prediction(result)
         text, confidence = self.keep_prediction(text, confidence)
 
-        hist = self.pred_history[session_id]
-        if text:
-            hist.append(text)
-            text = Counter(hist).most_common(1)[0][0]
+        decoded = self.decoders[session_id].update(text, confidence)
 
         return {
-            "text": text,
-            "confidence": float(confidence),
+            "text": decoded.text,
+            "confidence": float(decoded.confidence),
+            "emitted": decoded.emitted,
+            "transcript": " ".join(decoded.transcript),
             "ready": True,
-            "source": "roboflow",
+            "source": source,
             "dataset1_found": self.dataset_exists,
             "dataset1_labels_count": len(self.dataset_labels),
         }
 
+    def predict(self, session_id: str, image_base64: str, budget_ms: float | None = None) -> dict:
+        started = self.pacer.begin()
+        try:
+            frame = self.prepare_frame(session_id, image_base64)
+            outcomes = self.infer([(session_id, frame)], budget_ms)
+            output = self.finish_prediction(session_id, outcomes[0])
+        finally:
+            self.pacer.end(started)
+        output["pacing"] = self.pacing(session_id)
+        return output
+
+    def predict_batch(self, tiles: list[tuple[str, str]], budget_ms: float | None = None) -> list[dict]:
+        """
+        Predict for N (session_id, image_base64) tiles with one routed call per backend used.
+        Each tile is decoded by its own session's TemporalDecoder.
+        Errors are reported per tile so one bad frame does not drop the others.
+        """
+        outputs: list[dict] = [{} for _ in tiles]
+        ready: list[tuple[int, str, FramePayload]] = []
+        started = self.pacer.begin(len(tiles))
+        try:
+            for index, (session_id, image_base64) in enumerate(tiles):
+                try:
+                    frame = self.prepare_frame(session_id, image_base64)
+                except Exception as exc:
+                    outputs[index] = {"error": str(exc)}
+                    continue
+                ready.append((index, session_id, frame))
+
+            if ready:
+                try:
+                    outcomes = self.infer([(session_id, frame) for _, session_id, frame in ready], budget_ms)
+                except Exception as exc:
+                    outcomes = [exc] * len(ready)
+                for (index, session_id, _), outcome in zip(ready, outcomes):
+                    try:
+                        outputs[index] = self.finish_prediction(session_id, outcome)
+                    except Exception as exc:
+                        outputs[index] = {"error": str(exc)}
+        finally:
+            self.pacer.end(started, len(tiles))
+
+        for (session_id, _), output in zip(tiles, outputs):
+            output["session_id"] = session_id
+            output["pacing"] = self.pacing(session_id)
+        return outputs
+
 
 runtime: ModelRuntime | None = None
-app = FastAPI(title="Sign Translator Inference API")
+# Constructed by main() but only published as `runtime` once loading and warm-up finish.
+pending_runtime: ModelRuntime | None = None
+warmup_inference = True
+
+
+def load_runtime_in_background() -> None:
+    global runtime
+    loading = pending_runtime
+    if loading is None:
+        return
+    try:
+        loading.load()
+        loading.warm_up(run_inference=warmup_inference)
+    except Exception as exc:
+        loading.startup.error = str(exc)
+        loading.startup.phase = "failed"
+        print(f"[startup] failed: {exc}")
+        return
+    loading.ready = True
+    loading.startup.phase = "ready"
+    runtime = loading
+    print(f"[startup] ready (total {sum(loading.startup.phases.values()):.3f}s)")
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # Returning immediately lets uvicorn bind the socket; loading continues in a thread.
+    threading.Thread(target=load_runtime_in_background, name="runtime-loader", daemon=True).start()
+    yield
+
+
+app = FastAPI(title="Sign Translator Inference API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -203,11 +592,50 @@ def predict(req: PredictRequest):
     if runtime is None:
         return {"error": "Model not loaded"}
     try:
-        return runtime.predict(req.session_id, req.image_base64)
+        return runtime.predict(req.session_id, req.image_base64, req.latency_budget_ms)
     except Exception as exc:
         return {"error": str(exc)}
 
 
+@app.post("/predict_batch")
+def predict_batch(req: BatchPredictRequest):
+    if runtime is None:
+        return {"error": "Model not loaded"}
+    try:
+        tiles = [(tile.session_id, tile.image_base64) for tile in req.tiles]
+        return {"results": runtime.predict_batch(tiles, req.latency_budget_ms)}
+    except Exception as exc:
+        return {"error": str(exc)}
+
+
+@app.get("/transcript/{session_id}")
+def transcript(session_id: str):
+    if runtime is None:
+        return {"error": "Model not loaded"}
+    words = runtime.transcript(session_id)
+    return {"session_id": session_id, "words": words, "text": " ".join(words)}
+
+
+@app.delete("/transcript/{session_id}")
+def reset_transcript(session_id: str):
+    if runtime is None:
+        return {"error": "Model not loaded"}
+    runtime.reset_session(session_id)
+    return {"session_id": session_id, "reset": True}
+
+
+@app.get("/ready")
+def ready():
+    loading = runtime or pending_runtime
+    body = {
+        "ready": runtime is not None,
+        "phase": loading.startup.phase if loading is not None else "not_configured",
+        "phases": loading.startup.phases if loading is not None else {},
+        "error": loading.startup.error if loading is not None else "",
+    }
+    return JSONResponse(body, status_code=200 if runtime is not None else 503)
+
+
 @app.get("/health")
 def health():
     return {
@@ -218,6 +646,9 @@ def health():
         "dataset1_found": getattr(runtime, "dataset_exists", False),
         "dataset1_labels_count": len(getattr(runtime, "dataset_labels", []) or []),
         "dataset1_labels_preview": (getattr(runtime, "dataset_labels", []) or [])[:10],
+        "load": round(runtime.pacer.load(), 2) if runtime is not None else 0.0,
+        "sessions": len(runtime.last_seen) if runtime is not None else 0,
+        "routing": runtime.router.snapshot() if runtime is not None else {},
     }
 
 
@@ -228,18 +659,79 @@ def main() -> None:
     parser.add_argument("--api-url", default=os.getenv("ROBOFLOW_API_URL", "https://serverless.roboflow.com"))
     parser.add_argument("--min-confidence", type=float, default=float(os.getenv("ROBOFLOW_MIN_CONFIDENCE", "0.35")))
     parser.add_argument("--dataset", default=os.getenv("DATASET1_PATH", "dataset1"))
+    parser.add_argument("--decoder-alpha", type=float, default=0.6, help="EMA weight of each new frame")
+    parser.add_argument("--emit-threshold", type=float, default=0.5, help="Score at which a word is emitted")
+    parser.add_argument("--release-threshold", type=float, default=0.2, help="Score below which a word ends")
+    parser.add_argument(
+        "--backends",
+        default=os.getenv("SIGN_BACKENDS", "roboflow"),
+        help=f"Comma-separated backends in priority order ({', '.join(BACKEND_TYPES)})",
+    )
+    parser.add_argument("--classifier", default="models/sign_classifier.joblib", help="Bundle from train_model.py")
+    parser.add_argument("--sign-index", default="models/sign_index.npz", help="Index from build_sign_index.py")
+    parser.add_argument(
+        "--latency-budget-ms",
+        type=float,
+        default=800.0,
+        help="Default per-request budget when the client does not send one",
+    )
+    parser.add_argument(
+        "--hedge-percentile",
+        type=float,
+        default=95.0,
+        help="Send a hedged request to the next backend once the first is slower than this latency percentile",
+    )
+    parser.add_argument(
+        "--max-remote-inflight",
+        type=int,
+        default=16,
+        help="Cap on concurrent Roboflow calls; when reached, frames go to the next backend",
+    )
+    parser.add_argument(
+        "--roi-crop",
+        action="store_true",
+        help="Crop frames to a tracked box around the signer's motion (keep off for models trained on full frames)",
+    )
+    parser.add_argument(
+        "--session-ttl",
+        type=float,
+        default=300.0,
+        help="Seconds before an idle tile session is dropped",
+    )
+    parser.add_argument("--max-sessions", type=int, default=256, help="Most recently seen sessions kept in memory")
+    parser.add_argument(
+        "--no-warmup-inference",
+        action="store_true",
+        help="Skip the warm-up call to the backend (decoder warm-up still runs)",
+    )
     parser.add_argument("--host", default="127.0.0.1")
     parser.add_argument("--port", type=int, default=8000)
     args = parser.parse_args()
 
-    global runtime
-    runtime = ModelRuntime(
+    global pending_runtime, warmup_inference
+    print(f"[startup] imports: {time.perf_counter() - _MODULE_STARTED:.3f}s")
+    warmup_inference = not args.no_warmup_inference
+    pending_runtime = ModelRuntime(
         api_key=args.api_key,
         model_id=args.model_id,
         api_url=args.api_url,
         min_confidence=args.min_confidence,
         dataset_path=args.dataset,
+        decoder_alpha=args.decoder_alpha,
+        emit_threshold=args.emit_threshold,
+        release_threshold=args.release_threshold,
+        backends=[name.strip() for name in args.backends.split(",") if name.strip()],
+        classifier_path=args.classifier,
+        index_path=args.sign_index,
+        latency_budget_ms=args.latency_budget_ms,
+        hedge_percentile=args.hedge_percentile,
+        max_remote_inflight=args.max_remote_inflight,
+        roi_crop=args.roi_crop,
+        session_ttl_s=args.session_ttl,
+        max_sessions=args.max_sessions,
+        defer_load=True,
     )
+    pending_runtime.startup.phases["imports"] = round(time.perf_counter() - _MODULE_STARTED, 4)
     uvicorn.run(app, host=args.host, port=args.port)
 
 
@@ -1 +1,4 @@
 from .dataset import DatasetItem, load_dataset_index, parse_word_and_video_id
+from .decoder import DecoderUpdate, TemporalDecoder
+from .manifest import CrawlManifest, ManifestPage, ManifestVideo
+from .sign_index import IndexMatch, SignIndex
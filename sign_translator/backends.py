@@ -0,0 +1,457 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+import threading
+import time
+from typing import TYPE_CHECKING, Callable
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .frames import FramePayload
+
+Tile = tuple[str, "FramePayload"]  # (session_id, client frame)
+
+
+class Backend:
+    """
+    One inference source. prepare() runs on the request thread and captures everything the
+    call needs from shared state; infer_batch() runs on the backend's pool with only that
+    batch and returns one Roboflow-shaped result ({"predictions": [{"class", "confidence"}, ...]})
+    per tile.
+    """
+
+    name = "backend"
+    # Calls admitted at once; None means unbounded (local, short calls that simply queue).
+    max_inflight: int | None = None
+    workers = 4
+
+    def observe(self, session_id: str, frame: FramePayload) -> None:
+        """Called for every incoming frame, whether or not this backend is routed to."""
+
+    def available(self, session_id: str) -> bool:
+        return True
+
+    def prepare(self, tiles: list[Tile]) -> object:
+        return tiles
+
+    def infer_batch(self, batch) -> list[dict]:
+        raise NotImplementedError
+
+    def reset_session(self, session_id: str) -> None:
+        pass
+
+
+class RoboflowBackend(Backend):
+    name = "roboflow"
+
+    def __init__(self, client_factory: Callable[[], object], model_id: str, max_inflight: int = 16):
+        self.client = client_factory()
+        self.model_id = model_id
+        # Abandoned (hedged-away) calls keep their thread until the HTTP timeout; capping them
+        # keeps a slow upstream from holding more than this many threads.
+        self.max_inflight = max_inflight
+        self.workers = max_inflight
+
+    def prepare(self, tiles: list[Tile]) -> list:
+        # The client's JPEG goes out untouched unless the frame is cropped.
+        return [frame.remote_input() for _, frame in tiles]
+
+    def infer_batch(self, images: list) -> list[dict]:
+        if len(images) == 1:
+            return [self.client.infer(images[0], model_id=self.model_id)]
+        results = self.client.infer(images, model_id=self.model_id)
+        return results if isinstance(results, list) else [results]
+
+
+class _Window:
+    __slots__ = ("frames", "lock")
+
+    def __init__(self, maxlen: int):
+        self.frames: deque[np.ndarray] = deque(maxlen=maxlen)
+        self.lock = threading.Lock()
+
+
+class _SequenceBackend(Backend):
+    """
+    Keeps a per-session window of frame features; ready once the window is full.
+    Request threads append to a window while a late (queued or hedged) call may be
+    reading it, so each window has its own lock and calls get a copy taken in prepare().
+    """
+
+    def __init__(self, sequence_len: int, feature_dim: int, top_k: int = 5):
+        from .landmarks import extract_feature_vector_from_frame
+
+        self._extract = extract_feature_vector_from_frame
+        self.sequence_len = sequence_len
+        self.frame_size = int(np.sqrt(feature_dim))
+        self.top_k = top_k
+        self.windows: dict[str, _Window] = {}
+        self._windows_lock = threading.Lock()
+
+    def _window(self, session_id: str) -> _Window:
+        with self._windows_lock:
+            window = self.windows.get(session_id)
+            if window is None:
+                window = self.windows[session_id] = _Window(self.sequence_len)
+            return window
+
+    def observe(self, session_id: str, frame: FramePayload) -> None:
+        # Reduced-scale grayscale decode: the features are a frame_size x frame_size thumbnail.
+        features = self._extract(frame.gray(self.frame_size), frame_size=self.frame_size)
+        window = self._window(session_id)
+        with window.lock:
+            window.frames.append(features)
+
+    def available(self, session_id: str) -> bool:
+        window = self.windows.get(session_id)
+        return window is not None and len(window.frames) == self.sequence_len
+
+    def prepare(self, tiles: list[Tile]) -> np.ndarray:
+        """(n_tiles, sequence_len, feature_dim) snapshot of the tiles' windows."""
+        sequences = []
+        for session_id, _ in tiles:
+            window = self._window(session_id)
+            with window.lock:
+                sequences.append(np.stack(window.frames, axis=0))
+        return np.stack(sequences, axis=0)
+
+    def reset_session(self, session_id: str) -> None:
+        with self._windows_lock:
+            self.windows.pop(session_id, None)
+
+
+class ClassifierBackend(_SequenceBackend):
+    """Local model trained by train_model.py (joblib bundle)."""
+
+    name = "classifier"
+
+    def __init__(self, model_path: str | Path, top_k: int = 5):
+        import joblib
+
+        bundle = joblib.load(model_path)
+        self.model = bundle["model"]
+        self.classes = np.asarray(bundle["label_encoder"].classes_).astype(str)
+        super().__init__(int(bundle["sequence_len"]), int(bundle["feature_dim"]), top_k)
+
+    def infer_batch(self, sequences: np.ndarray) -> list[dict]:
+        probs = self.model.predict_proba(sequences.reshape(len(sequences), -1))
+        k = min(self.top_k, probs.shape[1])
+        results = []
+        for row in probs:
+            top = np.argsort(row)[::-1][:k]
+            results.append({"predictions": [{"class": self.classes[i], "confidence": float(row[i])} for i in top]})
+        return results
+
+
+class SignIndexBackend(_SequenceBackend):
+    """Nearest-neighbour lookup in the sign index from build_sign_index.py."""
+
+    name = "index"
+
+    def __init__(self, index_path: str | Path, top_k: int = 5):
+        from .sign_index import SignIndex
+
+        self.index = SignIndex.load(index_path)
+        super().__init__(self.index.sequence_len, self.index.feature_dim, top_k)
+
+    def infer_batch(self, sequences: np.ndarray) -> list[dict]:
+        results = []
+        for matches in self.index.query_batch(sequences, k=self.top_k):
+            best: dict[str, float] = {}
+            for match in matches:
+                best[match.label] = max(best.get(match.label, 0.0), max(0.0, match.score))
+            results.append({"predictions": [{"class": label, "confidence": score} for label, score in best.items()]})
+        return results
+
+
+class BackendStats:
+    """Recent latency window and health of one backend."""
+
+    def __init__(self, window: int = 200, failure_limit: int = 3, cooldown_s: float = 10.0):
+        self.latencies_ms: deque[float] = deque(maxlen=window)
+        self.failure_limit = failure_limit
+        self.cooldown_s = cooldown_s
+        self.consecutive_failures = 0
+        self.unhealthy_until = 0.0
+        self.calls = 0
+        self.failures = 0
+        self.wins = 0
+        self._lock = threading.Lock()
+
+    def record(self, latency_ms: float, ok: bool) -> None:
+        with self._lock:
+            self.calls += 1
+            self.latencies_ms.append(latency_ms)
+            if ok:
+                self.consecutive_failures = 0
+                return
+            self.failures += 1
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= self.failure_limit:
+                self.unhealthy_until = time.monotonic() + self.cooldown_s
+
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.unhealthy_until
+
+    def percentile(self, q: float) -> float | None:
+        with self._lock:
+            if len(self.latencies_ms) < 5:
+                return None
+            return float(np.percentile(list(self.latencies_ms), q))
+
+    def snapshot(self) -> dict:
+        p50 = self.percentile(50)
+        p95 = self.percentile(95)
+        return {
+            "healthy": self.healthy(),
+            "calls": self.calls,
+            "failures": self.failures,
+            "wins": self.wins,
+            "p50_ms": round(p50, 1) if p50 is not None else None,
+            "p95_ms": round(p95, 1) if p95 is not None else None,
+        }
+
+
+class BackendRouter:
+    """
+    Routes each tile to the first healthy backend (in priority order) that is available for
+    its session and whose observed median latency fits the request's budget, falling back to
+    the fastest one. Tiles sent to the same backend share one call; a batch can therefore be
+    split, e.g. full-window sessions to the classifier and new ones to Roboflow.
+    If a call has not answered within its backend's hedge_percentile latency (capped by the
+    budget), the same tiles are sent to the next candidate and the first successful answer
+    wins; the other request is cancelled (or its result discarded if already running).
+    """
+
+    def __init__(
+        self,
+        backends: list[Backend],
+        default_budget_ms: float = 800.0,
+        hedge_percentile: float = 95.0,
+        max_wait_s: float = 15.0,
+    ):
+        if not backends:
+            raise ValueError("At least one backend is required")
+        self.backends = backends
+        self.stats = {backend.name: BackendStats() for backend in backends}
+        self.default_budget_ms = default_budget_ms
+        self.hedge_percentile = hedge_percentile
+        self.max_wait_s = max_wait_s
+        # One pool per backend, so hedged local calls never queue behind slow remote ones.
+        self.executors = {
+            backend.name: ThreadPoolExecutor(max_workers=backend.workers, thread_name_prefix=f"backend-{backend.name}")
+            for backend in backends
+        }
+        self.inflight = {backend.name: 0 for backend in backends}
+        self.saturated = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.cancelled = 0
+        self._lock = threading.Lock()
+        # Runs the extra groups of a split batch, so their calls overlap instead of queueing.
+        self._groups = ThreadPoolExecutor(max_workers=len(backends), thread_name_prefix="backend-group")
+
+    @property
+    def names(self) -> list[str]:
+        return [backend.name for backend in self.backends]
+
+    def observe(self, session_id: str, frame: FramePayload) -> None:
+        for backend in self.backends:
+            backend.observe(session_id, frame)
+
+    def reset_session(self, session_id: str) -> None:
+        for backend in self.backends:
+            backend.reset_session(session_id)
+
+    def _has_room(self, backend: Backend) -> bool:
+        return backend.max_inflight is None or self.inflight[backend.name] < backend.max_inflight
+
+    def candidates(self, budget_ms: float) -> list[Backend]:
+        """Backends with room for a call, best first for this budget (availability not checked)."""
+        ready = [backend for backend in self.backends if self._has_room(backend)]
+        usable = [backend for backend in ready if self.stats[backend.name].healthy()]
+        if not usable:
+            # Everything is cooling down: still try whatever can answer rather than fail outright.
+            usable = ready
+
+        def fits(backend: Backend) -> bool:
+            p50 = self.stats[backend.name].percentile(50)
+            return p50 is None or p50 <= budget_ms
+
+        fitting = [b for b in usable if fits(b)]
+        if fitting:
+            return fitting + [b for b in usable if b not in fitting]
+        return sorted(usable, key=lambda b: self.stats[b.name].percentile(50) or 0.0)
+
+    def _submit(self, backend: Backend, tiles: list[Tile]) -> Future | None:
+        """Starts a call on the backend's own pool, or returns None if it is at its in-flight cap."""
+        batch = backend.prepare(tiles)
+        with self._lock:
+            if not self._has_room(backend):
+                self.saturated += 1
+                return None
+            self.inflight[backend.name] += 1
+        try:
+            return self.executors[backend.name].submit(self._call, backend, batch)
+        except Exception:
+            self._release(backend)
+            raise
+
+    def _release(self, backend: Backend) -> None:
+        with self._lock:
+            self.inflight[backend.name] -= 1
+
+    def _call(self, backend: Backend, batch) -> list[dict]:
+        started = time.perf_counter()
+        try:
+            results = backend.infer_batch(batch)
+        except Exception:
+            self.stats[backend.name].record((time.perf_counter() - started) * 1000.0, ok=False)
+            raise
+        finally:
+            self._release(backend)
+        self.stats[backend.name].record((time.perf_counter() - started) * 1000.0, ok=True)
+        return results
+
+    def infer_batch(
+        self, tiles: list[Tile], budget_ms: float | None = None
+    ) -> list[tuple[str, dict] | Exception | None]:
+        """
+        One entry per tile: (name of the backend that answered, result), the exception of the
+        call it was part of, or None if no backend can serve its session yet (sequence
+        backends still filling its window).
+        """
+        budget_ms = float(budget_ms or self.default_budget_ms)
+        ranked = self.candidates(budget_ms)
+        outcomes: list[tuple[str, dict] | Exception | None] = [None] * len(tiles)
+        groups: dict[str, list[int]] = {}
+        for index, (session_id, _) in enumerate(tiles):
+            if not any(backend.available(session_id) for backend in self.backends):
+                continue
+            backend = next((b for b in ranked if b.available(session_id)), None)
+            if backend is None:
+                outcomes[index] = RuntimeError("All backends are at their in-flight limit")
+                continue
+            groups.setdefault(backend.name, []).append(index)
+
+        def run(indices: list[int]) -> None:
+            group = [tiles[index] for index in indices]
+            # The group's backend comes first; hedges go to later ones that can serve every tile.
+            queue = [b for b in ranked if all(b.available(sid) for sid, _ in group)]
+            try:
+                name, results = self._route(group, queue, budget_ms)
+            except Exception as exc:
+                for index in indices:
+                    outcomes[index] = exc
+                return
+            for index, result in zip(indices, results):
+                outcomes[index] = (name, result)
+
+        first, *rest = list(groups.values()) or [[]]
+        pending = [self._groups.submit(run, indices) for indices in rest]
+        if first:
+            run(first)
+        for future in pending:
+            future.result()
+        return outcomes
+
+    def _route(self, tiles: list[Tile], queue: list[Backend], budget_ms: float) -> tuple[str, list[dict]]:
+        """Returns (name of the backend that answered, one result per tile), hedging along queue."""
+        started = time.monotonic()
+        running: dict[Future, Backend] = {}
+        hedged = False
+        last_error: Exception | None = None
+
+        def launch() -> None:
+            # Skips backends that filled up since candidates() was computed.
+            while queue:
+                backend = queue.pop(0)
+                future = self._submit(backend, tiles)
+                if future is not None:
+                    running[future] = backend
+                    return
+
+        launch()
+        if not running:
+            raise RuntimeError("All backends are at their in-flight limit")
+        first = next(iter(running.values()))
+        while running:
+            elapsed = time.monotonic() - started
+            if elapsed >= self.max_wait_s:
+                break
+            timeout = self.max_wait_s - elapsed
+            if queue and len(running) == 1:
+                primary = next(iter(running.values()))
+                hedge_after = self.stats[primary.name].percentile(self.hedge_percentile)
+                hedge_after_ms = budget_ms if hedge_after is None else min(hedge_after, budget_ms)
+                timeout = min(timeout, max(0.0, hedge_after_ms / 1000.0 - elapsed))
+
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                if queue and len(running) == 1:
+                    launch()
+                    if len(running) > 1:
+                        hedged = True
+                        with self._lock:
+                            self.hedged += 1
+                continue
+
+            for future in done:
+                backend = running.pop(future)
+                try:
+                    results = future.result()
+                except Exception as exc:
+                    last_error = exc
+                    continue
+                self._finish(backend, hedge_win=hedged and backend is not first, losers=list(running))
+                return backend.name, results
+
+            if not running and queue:
+                launch()
+
+        for future in running:
+            future.cancel()
+        if running:
+            raise TimeoutError(f"No backend answered within {self.max_wait_s:.0f}s")
+        raise RuntimeError(f"All backends failed: {last_error}")
+
+    def _finish(self, winner: Backend, hedge_win: bool, losers: list[Future]) -> None:
+        # A running loser cannot be interrupted; cancel() only stops it if still queued,
+        # otherwise its result is simply discarded. Both count as cancelled.
+        for future in losers:
+            future.cancel()
+        with self._lock:
+            self.stats[winner.name].wins += 1
+            self.hedge_wins += int(hedge_win)
+            self.cancelled += len(losers)
+
+    def warm_up(self, tile: Tile) -> dict[str, float]:
+        """One call per backend; sequence backends get their window filled with the probe frame first."""
+        session_id, frame = tile
+        timings = {}
+        for backend in self.backends:
+            for _ in range(getattr(backend, "sequence_len", 0)):
+                backend.observe(session_id, frame)
+            started = time.perf_counter()
+            try:
+                # Not recorded in the latency window: the first call includes connection setup.
+                backend.infer_batch(backend.prepare([tile]))
+            except Exception as exc:
+                print(f"[startup] warm-up of {backend.name} failed: {exc}")
+            timings[backend.name] = round(time.perf_counter() - started, 4)
+            backend.reset_session(session_id)
+        return timings
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counters = {
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "cancelled": self.cancelled,
+                "saturated": self.saturated,
+                "inflight": dict(self.inflight),
+            }
+        return {"backends": {name: stats.snapshot() for name, stats in self.stats.items()}, **counters}
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+
+
+@dataclass
+class DecoderUpdate:
+    text: str  # word currently held (last emitted and not yet released), "" otherwise
+    confidence: float  # running score of that word
+    emitted: str  # word emitted by this update, "" otherwise
+    transcript: list[str]
+
+
+class TemporalDecoder:
+    """
+    Incremental, confidence-weighted smoothing of per-frame predictions for one session.
+
+    Each label keeps an exponential moving average of its confidence
+    (score = (1 - alpha) * score + alpha * confidence on every step, 0 for frames where it
+    was not predicted). Decay is applied lazily from the step the label was last seen, so an
+    update only touches the observed label: O(1) per frame regardless of vocabulary size.
+
+    A label is emitted as a word when its score reaches emit_threshold and it is not the
+    word currently held. The held word is released once its score decays below
+    release_threshold, so a sign repeated after a pause is emitted again.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.6,
+        emit_threshold: float = 0.5,
+        release_threshold: float = 0.2,
+        max_transcript: int = 50,
+    ):
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.decay = 1.0 - alpha
+        self.emit_threshold = emit_threshold
+        self.release_threshold = release_threshold
+        self.step = 0
+        self.scores: dict[str, tuple[float, int]] = {}  # label -> (score, step it was stored at)
+        self.active = ""
+        self.transcript: deque[str] = deque(maxlen=max_transcript)
+
+    def score(self, label: str) -> float:
+        stored = self.scores.get(label)
+        if stored is None:
+            return 0.0
+        value, at_step = stored
+        return value * self.decay ** (self.step - at_step)
+
+    def update(self, label: str, confidence: float) -> DecoderUpdate:
+        """Advance one frame; label may be "" when the frame had no accepted prediction."""
+        self.step += 1
+        emitted = ""
+
+        if label:
+            value = self.score(label) + self.alpha * float(confidence)
+            self.scores[label] = (value, self.step)
+            if label != self.active and value >= self.emit_threshold:
+                self.active = label
+                self.transcript.append(label)
+                emitted = label
+
+        if self.active and self.score(self.active) < self.release_threshold:
+            self.active = ""
+
+        if self.step % 64 == 0:
+            self._prune()
+
+        return DecoderUpdate(
+            text=self.active,
+            confidence=self.score(self.active) if self.active else 0.0,
+            emitted=emitted,
+            transcript=list(self.transcript),
+        )
+
+    def _prune(self) -> None:
+        # Drop labels whose decayed score no longer matters; amortised over many updates.
+        self.scores = {
+            label: stored for label, stored in self.scores.items()
+            if label == self.active or self.score(label) >= 1e-3
+        }
+
+    def reset(self) -> None:
+        self.step = 0
+        self.scores.clear()
+        self.active = ""
+        self.transcript.clear()
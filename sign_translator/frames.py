@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import base64
+
+import cv2
+import numpy as np
+
+Box = tuple[float, float, float, float]  # (x0, y0, x1, y1) as fractions of the frame
+
+# (scale divisor, grayscale flag, colour flag), coarsest first. 1/2 and 1/4 are left out:
+# with OpenCV's libjpeg-turbo they measured no faster than a full-size grayscale decode.
+_REDUCTIONS = (
+    (8, cv2.IMREAD_REDUCED_GRAYSCALE_8, cv2.IMREAD_REDUCED_COLOR_8),
+    (1, cv2.IMREAD_GRAYSCALE, cv2.IMREAD_COLOR),
+)
+# Start-of-frame markers (baseline, progressive, ...); C4/C8/CC are not SOF segments.
+_SOF_MARKERS = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def jpeg_size(data: bytes) -> tuple[int, int] | None:
+    """(width, height) from the JPEG header, without decoding; None if no frame header is found."""
+    pos = 2
+    while pos + 9 <= len(data):
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            pos += 1
+            continue
+        if marker in _SOF_MARKERS:
+            return int.from_bytes(data[pos + 7:pos + 9], "big"), int.from_bytes(data[pos + 5:pos + 7], "big")
+        pos += 2 + int.from_bytes(data[pos + 2:pos + 4], "big")
+    return None
+
+
+class FramePayload:
+    """
+    One JPEG frame from a client. Nothing is decoded up front: each consumer asks for the
+    view it needs (grayscale or colour, minimum size) and gets the cheapest decode that
+    covers it, cropped to `roi` when set. Decodes are cached and a finer cached decode is
+    reused rather than decoding again, so the motion thumbnail and the backends usually
+    share one grayscale decode. `gray_side` tells thumbnail() how large a grayscale view the
+    backends will want, so that shared decode is picked first.
+    """
+
+    def __init__(self, image_base64: str, gray_side: int = 0):
+        self.base64 = image_base64.split(",")[-1]
+        self.jpeg = np.frombuffer(base64.b64decode(self.base64), dtype=np.uint8)
+        self.gray_side = gray_side
+        self.roi: Box | None = None
+        self._decoded: dict[int, np.ndarray] = {}
+        self._size: tuple[int, int] | None = None
+
+    def _decode(self, flag: int) -> np.ndarray:
+        image = self._decoded.get(flag)
+        if image is None:
+            image = cv2.imdecode(self.jpeg, flag)
+            if image is None:
+                raise ValueError("Invalid image data")
+            self._decoded[flag] = image
+        return image
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """Full-resolution (width, height)."""
+        if self._size is None:
+            self._size = jpeg_size(self.jpeg[:65536].tobytes())
+            if self._size is None:
+                height, width = self._decode(cv2.IMREAD_GRAYSCALE).shape[:2]
+                self._size = (width, height)
+        return self._size
+
+    def _crop(self, image: np.ndarray, roi: Box | None) -> np.ndarray:
+        if roi is None:
+            return image
+        height, width = image.shape[:2]
+        x0, y0, x1, y1 = roi
+        left, top = int(x0 * width), int(y0 * height)
+        right, bottom = max(int(x1 * width), left + 1), max(int(y1 * height), top + 1)
+        return image[top:bottom, left:right]
+
+    def _view(self, min_side: int, color: bool, roi: Box | None) -> np.ndarray:
+        width, height = self.size
+        if roi is not None:
+            x0, y0, x1, y1 = roi
+            width, height = width * (x1 - x0), height * (y1 - y0)
+        flags = [
+            color_flag if color else gray_flag
+            for divisor, gray_flag, color_flag in _REDUCTIONS
+            if divisor == 1 or (min_side > 0 and min(width, height) / divisor >= min_side)
+        ]
+        flag = next((f for f in flags if f in self._decoded), flags[0])
+        return self._crop(self._decode(flag), roi)
+
+    def thumbnail(self, min_side: int = 24) -> np.ndarray:
+        """Whole frame (never cropped), grayscale, for motion and ROI tracking."""
+        return self._view(max(min_side, self.gray_side), color=False, roi=None)
+
+    def gray(self, min_side: int = 0) -> np.ndarray:
+        """Grayscale view whose shorter side is at least min_side (0 = full resolution)."""
+        return self._view(min_side, color=False, roi=self.roi)
+
+    def color(self, min_side: int = 0) -> np.ndarray:
+        """BGR view whose shorter side is at least min_side (0 = full resolution)."""
+        return self._view(min_side, color=True, roi=self.roi)
+
+    def remote_input(self) -> str | np.ndarray:
+        """What to send to a remote model: the client's JPEG as-is unless it has to be cropped."""
+        return self.base64 if self.roi is None else self.color()
+
+
+class RoiTracker:
+    """
+    Smoothed box around the moving part of a session's frames (hands and upper body of the
+    signer), updated from the thumbnail difference the motion estimate already computes.
+    Returns None while the box still covers nearly the whole frame, so no crop is needed.
+    """
+
+    def __init__(
+        self,
+        threshold: int = 12,
+        margin: float = 0.15,
+        min_size: float = 0.5,
+        smoothing: float = 0.3,
+        full_frame: float = 0.9,
+    ):
+        self.threshold = threshold
+        self.margin = margin
+        self.min_size = min_size
+        self.smoothing = smoothing
+        self.full_frame = full_frame
+        self.box: Box = (0.0, 0.0, 1.0, 1.0)
+
+    def update(self, diff: np.ndarray) -> Box | None:
+        ys, xs = np.nonzero(diff > self.threshold)
+        if len(xs) >= 3:
+            height, width = diff.shape[:2]
+            target = self._expand(
+                xs.min() / width, ys.min() / height, (xs.max() + 1) / width, (ys.max() + 1) / height
+            )
+            a = self.smoothing
+            self.box = tuple(float((1.0 - a) * old + a * new) for old, new in zip(self.box, target))
+        # With (almost) no motion the previous box is kept: a still signer stays framed.
+        x0, y0, x1, y1 = self.box
+        if (x1 - x0) * (y1 - y0) >= self.full_frame:
+            return None
+        return self.box
+
+    def _expand(self, x0: float, y0: float, x1: float, y1: float) -> Box:
+        pad_x = (x1 - x0) * self.margin
+        pad_y = (y1 - y0) * self.margin
+        x0, x1 = self._span(x0 - pad_x, x1 + pad_x)
+        y0, y1 = self._span(y0 - pad_y, y1 + pad_y)
+        return x0, y0, x1, y1
+
+    def _span(self, lo: float, hi: float) -> tuple[float, float]:
+        if hi - lo < self.min_size:
+            centre = (lo + hi) / 2.0
+            lo, hi = centre - self.min_size / 2.0, centre + self.min_size / 2.0
+        shift = max(0.0, -lo) - max(0.0, hi - 1.0)
+        return max(0.0, lo + shift), min(1.0, hi + shift)
@@ -17,7 +17,8 @@ class SequenceSample:
 
 
 def extract_feature_vector_from_frame(frame: np.ndarray, frame_size: int = 32) -> np.ndarray:
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    # Accepts BGR or an already grayscale frame (e.g. decoded with IMREAD_GRAYSCALE).
+    gray = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
     resized = cv2.resize(gray, (frame_size, frame_size), interpolation=cv2.INTER_AREA)
     normalized = resized.astype(np.float32) / 255.0
     return normalized.flatten()
@@ -36,20 +37,25 @@ def _resample_features(feature_list: list[np.ndarray], sequence_len: int) -> np.
     return arr[idx]
 
 
-def extract_sequence_from_video(
+def extract_frame_features(
     video_path: Path,
-    sequence_len: int = 30,
-    max_frames: int = 120,
+    max_frames: int = 0,
     frame_size: int = 32,
-) -> np.ndarray:
+) -> tuple[np.ndarray, float]:
+    """
+    Per-frame feature vectors of a video, without resampling.
+    Returns (features, fps); features has shape (n_frames, feature_dim).
+    max_frames <= 0 reads the whole video.
+    """
     cap = cv2.VideoCapture(str(video_path))
     if not cap.isOpened():
         raise RuntimeError(f"Cannot open video: {video_path}")
 
+    fps = float(cap.get(cv2.CAP_PROP_FPS) or 0.0)
     frame_features: list[np.ndarray] = []
 
     read_count = 0
-    while read_count < max_frames:
+    while max_frames <= 0 or read_count < max_frames:
         ok, frame = cap.read()
         if not ok:
             break
@@ -61,7 +67,17 @@ def extract_sequence_from_video(
     if not frame_features:
         raise RuntimeError(f"No valid frames found: {video_path}")
 
-    return _resample_features(frame_features, sequence_len)
+    return np.stack(frame_features, axis=0), fps
+
+
+def extract_sequence_from_video(
+    video_path: Path,
+    sequence_len: int = 30,
+    max_frames: int = 120,
+    frame_size: int = 32,
+) -> np.ndarray:
+    features, _ = extract_frame_features(video_path, max_frames=max_frames, frame_size=frame_size)
+    return _resample_features(list(features), sequence_len)
 
 
 def build_feature_dataset(
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+import json
+import os
+from pathlib import Path
+import threading
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class ManifestVideo:
+    vid_id: str
+    word: str
+    url: str
+    path: str = ""  # filename inside the dataset dir; empty until downloaded
+    size: int = 0
+    etag: str = ""
+    last_modified: str = ""
+
+
+@dataclass
+class ManifestPage:
+    url: str
+    etag: str = ""
+    last_modified: str = ""
+    total_pages: int = 1
+    entries: list[dict[str, str]] = field(default_factory=list)  # {"word", "vid_id", "url"}
+
+
+class CrawlManifest:
+    """
+    Crawl state persisted next to the downloaded videos (<dataset>/manifest.json).
+    Maps vid_id -> video record and result-page url -> validators + parsed entries,
+    so later runs can send conditional requests and skip known-good files.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        videos: dict[str, ManifestVideo] | None = None,
+        pages: dict[str, ManifestPage] | None = None,
+    ):
+        self.root = Path(root)
+        self.videos: dict[str, ManifestVideo] = videos or {}
+        self.pages: dict[str, ManifestPage] = pages or {}
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self.root / MANIFEST_NAME
+
+    @classmethod
+    def load(cls, root: str | Path) -> "CrawlManifest":
+        manifest_path = Path(root) / MANIFEST_NAME
+        if not manifest_path.is_file():
+            return cls(root)
+        try:
+            raw = json.loads(manifest_path.read_text(encoding="utf-8"))
+            if raw.get("version") != MANIFEST_VERSION:
+                return cls(root)
+            videos = {vid: ManifestVideo(**rec) for vid, rec in raw.get("videos", {}).items()}
+            pages = {url: ManifestPage(**rec) for url, rec in raw.get("pages", {}).items()}
+        except (OSError, ValueError, TypeError):
+            print(f"[manifest] unreadable, starting fresh: {manifest_path}")
+            return cls(root)
+        return cls(root, videos=videos, pages=pages)
+
+    def set_page(self, page: ManifestPage) -> None:
+        with self._lock:
+            self.pages[page.url] = page
+
+    def set_video(self, video: ManifestVideo) -> None:
+        with self._lock:
+            self.videos[video.vid_id] = video
+
+    def save(self) -> None:
+        with self._lock:
+            payload = {
+                "version": MANIFEST_VERSION,
+                "videos": {vid: asdict(rec) for vid, rec in sorted(self.videos.items())},
+                "pages": {url: asdict(rec) for url, rec in sorted(self.pages.items())},
+            }
+        self.root.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".json.tmp")
+        temp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=1), encoding="utf-8")
+        os.replace(temp_path, self.path)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+
+@dataclass
+class IndexMatch:
+    label: str
+    vid_id: str
+    score: float  # cosine similarity in [-1, 1]
+
+
+class SignIndex:
+    """
+    Nearest-neighbour lookup over the one-shot sign index written by build_sign_index.py
+    (npz with X: (n, sequence_len, feature_dim), y: labels, vid: video ids).
+    Sequences are mean-centred and L2-normalised once at load, so a query is one matrix-vector product.
+    """
+
+    def __init__(self, X: np.ndarray, labels: np.ndarray, vid_ids: np.ndarray):
+        if X.ndim != 3:
+            raise ValueError(f"Expected X with shape (n, sequence_len, feature_dim), got {X.shape}")
+        self.sequence_len = int(X.shape[1])
+        self.feature_dim = int(X.shape[2])
+        self.frame_size = int(np.sqrt(self.feature_dim))
+        self.labels = np.asarray(labels).astype(str)
+        self.vid_ids = np.asarray(vid_ids).astype(str)
+        self.vectors = self._normalize(X.reshape(len(X), -1).astype(np.float32))
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SignIndex":
+        data = np.load(path, allow_pickle=True)
+        return cls(data["X"], data["y"], data["vid"])
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        centred = vectors - vectors.mean(axis=1, keepdims=True)
+        norms = np.linalg.norm(centred, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        return centred / norms
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def query(self, sequence: np.ndarray, k: int = 5) -> list[IndexMatch]:
+        """Top-k matches for one (sequence_len, feature_dim) sequence."""
+        return self.query_batch(sequence[None, ...], k=k)[0]
+
+    def query_batch(self, sequences: np.ndarray, k: int = 5) -> list[list[IndexMatch]]:
+        if sequences.shape[1:] != (self.sequence_len, self.feature_dim):
+            raise ValueError(
+                f"Query shape {sequences.shape[1:]} does not match index {(self.sequence_len, self.feature_dim)}"
+            )
+        queries = self._normalize(sequences.reshape(len(sequences), -1).astype(np.float32))
+        scores = queries @ self.vectors.T
+        k = min(k, scores.shape[1])
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        results = []
+        for row, candidates in enumerate(top):
+            ordered = candidates[np.argsort(-scores[row, candidates])]
+            results.append(
+                [IndexMatch(str(self.labels[i]), str(self.vid_ids[i]), float(scores[row, i])) for i in ordered]
+            )
+        return results
@@ -12,6 +12,25 @@ from sklearn.preprocessing import LabelEncoder, StandardScaler
 from sklearn.linear_model import SGDClassifier
 
 
+def build_model() -> Pipeline:
+    return Pipeline(
+        steps=[
+            ("scaler", StandardScaler()),
+            (
+                "clf",
+                SGDClassifier(
+                    loss="log_loss",
+                    alpha=1e-4,
+                    max_iter=2000,
+                    tol=1e-3,
+                    class_weight="balanced",
+                    random_state=42,
+                ),
+            ),
+        ]
+    )
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Train sign-to-text classifier from extracted features")
     parser.add_argument("--input", default="processed/sign_dataset.npz")
@@ -66,22 +85,7 @@ def main() -> None:
         stratify=stratify_target,
     )
 
-    model = Pipeline(
-        steps=[
-            ("scaler", StandardScaler()),
-            (
-                "clf",
-                SGDClassifier(
-                    loss="log_loss",
-                    alpha=1e-4,
-                    max_iter=2000,
-                    tol=1e-3,
-                    class_weight="balanced",
-                    random_state=42,
-                ),
-            ),
-        ]
-    )
+    model = build_model()
 
     model.fit(X_train, y_train)
 
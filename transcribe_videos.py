@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+import json
+from pathlib import Path
+from typing import Iterator
+
+import joblib
+import numpy as np
+
+from sign_translator.dataset import VIDEO_EXTENSIONS
+from sign_translator.landmarks import extract_frame_features
+
+DEFAULT_FPS = 25.0
+# Windows built and classified per predict_proba call: batched, but memory stays bounded
+# (1024 x 30 x 1024 float32 features is ~125 MB) however long the recording is.
+WINDOW_CHUNK = 1024
+
+_bundle: dict | None = None
+
+
+@dataclass
+class CaptionSegment:
+    start: float
+    end: float
+    text: str
+    confidence: float
+
+
+def _init_worker(model_path: str) -> None:
+    global _bundle
+    _bundle = joblib.load(model_path)
+
+
+def collect_videos(inputs: list[str]) -> list[tuple[Path, Path]]:
+    """
+    (video, output stem relative to --output-dir) pairs. Videos found in a directory keep
+    their subfolders, so same-named recordings in different folders do not overwrite each
+    other; a name that would still collide (e.g. two inputs) is an error.
+    """
+    videos: list[tuple[Path, Path]] = []
+    for raw in inputs:
+        path = Path(raw)
+        if path.is_dir():
+            videos.extend(
+                (p, p.relative_to(path).with_suffix("")) for p in sorted(path.rglob("*"))
+                if p.is_file() and p.suffix.lower() in VIDEO_EXTENSIONS
+            )
+        elif path.is_file():
+            videos.append((path, Path(path.stem)))
+        else:
+            print(f"[warn] not found: {path}")
+
+    seen: dict[Path, Path] = {}
+    for video, stem in videos:
+        if stem in seen:
+            raise ValueError(f"Output name collision: {seen[stem]} and {video} both map to {stem}")
+        seen[stem] = video
+    return videos
+
+
+def sliding_windows(
+    features: np.ndarray,
+    sequence_len: int,
+    window_frames: int,
+    stride: int,
+    chunk_size: int = WINDOW_CHUNK,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Yields flattened (n, sequence_len * feature_dim) windows over per-frame features and the
+    start frame index of each, at most chunk_size windows at a time.
+
+    Each window spans window_frames frames (at most len(features)) and is resampled to
+    sequence_len frames with the same linspace indexing as training (_resample_features
+    over up to max_frames frames), so the model sees the time scale it was trained on.
+    """
+    offsets = np.round(np.linspace(0, window_frames - 1, sequence_len)).astype(int)
+    starts = np.arange(0, len(features) - window_frames + 1, stride)
+    for begin in range(0, len(starts), chunk_size):
+        chunk = starts[begin:begin + chunk_size]
+        windows = features[chunk[:, None] + offsets[None, :]]
+        yield windows.reshape(len(windows), -1), chunk
+
+
+def merge_window_labels(
+    labels: list[str],
+    confidences: np.ndarray,
+    starts: np.ndarray,
+    window_frames: int,
+    stride: int,
+    fps: float,
+    min_confidence: float,
+) -> list[CaptionSegment]:
+    """
+    Windows overlap, so each one only owns the centre `stride` frames of its span (the first
+    and last also own the video's edges). Slots tile the video without overlapping, so a
+    label change never produces stacked cues; consecutive slots with the same label merge.
+    """
+    if not len(starts):
+        return []
+    slot = min(stride, window_frames)
+    lead = (window_frames - slot) // 2
+    first, last_start = int(starts[0]), int(starts[-1])
+
+    spans: list[tuple[int, int, str, float]] = []
+    for label, conf, start in zip(labels, confidences.tolist(), starts.tolist()):
+        if conf < min_confidence:
+            continue
+        begin = first if start == first else start + lead
+        end = last_start + window_frames if start == last_start else start + lead + slot
+        if spans and spans[-1][2] == label and begin <= spans[-1][1]:
+            spans[-1] = (spans[-1][0], end, label, max(spans[-1][3], conf))
+        else:
+            spans.append((begin, end, label, conf))
+    return [CaptionSegment(start=b / fps, end=e / fps, text=label, confidence=c) for b, e, label, c in spans]
+
+
+def transcribe_video(
+    video_path: Path,
+    stride: int,
+    min_confidence: float,
+    window_frames: int = 120,
+) -> list[CaptionSegment]:
+    if _bundle is None:
+        raise RuntimeError("Model not loaded")
+
+    model = _bundle["model"]
+    label_encoder = _bundle["label_encoder"]
+    sequence_len = int(_bundle["sequence_len"])
+    frame_size = int(np.sqrt(int(_bundle["feature_dim"])))
+
+    features, fps = extract_frame_features(video_path, max_frames=0, frame_size=frame_size)
+    if fps <= 0:
+        fps = DEFAULT_FPS
+
+    # Videos shorter than one window yield a single window over all their frames, as short
+    # training videos do.
+    if not len(features):
+        return []
+    window_frames = min(max(window_frames, 1), len(features))
+    best_parts, confidence_parts, start_parts = [], [], []
+    for x, chunk_starts in sliding_windows(features, sequence_len, window_frames, stride):
+        probs = model.predict_proba(x)
+        best = np.argmax(probs, axis=1)
+        best_parts.append(best)
+        confidence_parts.append(probs[np.arange(len(best)), best])
+        start_parts.append(chunk_starts)
+    if not best_parts:
+        return []
+    best_idx = np.concatenate(best_parts)
+    confidences = np.concatenate(confidence_parts)
+    starts = np.concatenate(start_parts)
+    labels = [str(label) for label in label_encoder.inverse_transform(best_idx)]
+
+    return merge_window_labels(labels, confidences, starts, window_frames, stride, fps, min_confidence)
+
+
+def _srt_timestamp(seconds: float) -> str:
+    millis = int(round(seconds * 1000))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+
+
+def write_srt(segments: list[CaptionSegment], out_path: Path) -> None:
+    blocks = []
+    for index, seg in enumerate(segments, start=1):
+        blocks.append(
+            f"{index}\n{_srt_timestamp(seg.start)} --> {_srt_timestamp(seg.end)}\n{seg.text}\n"
+        )
+    out_path.write_text("\n".join(blocks), encoding="utf-8")
+
+
+def write_json(video_path: Path, segments: list[CaptionSegment], out_path: Path) -> None:
+    payload = {
+        "video": str(video_path),
+        "segments": [asdict(seg) for seg in segments],
+    }
+    out_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def process_video(
+    video_path: Path,
+    output_stem: Path,
+    formats: list[str],
+    stride: int,
+    min_confidence: float,
+    window_frames: int,
+) -> tuple[Path, int]:
+    segments = transcribe_video(
+        video_path, stride=stride, min_confidence=min_confidence, window_frames=window_frames
+    )
+    output_stem.parent.mkdir(parents=True, exist_ok=True)
+    if "srt" in formats:
+        write_srt(segments, output_stem.with_name(f"{output_stem.name}.srt"))
+    if "json" in formats:
+        write_json(video_path, segments, output_stem.with_name(f"{output_stem.name}.json"))
+    return video_path, len(segments)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Transcribe recorded sign videos offline with the trained classifier")
+    parser.add_argument("inputs", nargs="+", help="Video files and/or directories")
+    parser.add_argument("--model", default="models/sign_classifier.joblib")
+    parser.add_argument("--output-dir", default="transcripts")
+    parser.add_argument("--format", choices=["srt", "json", "both"], default="both")
+    parser.add_argument(
+        "--window-frames",
+        type=int,
+        default=120,
+        help="Frames per window, resampled to the model's sequence_len (match prepare_dataset.py --max-frames)",
+    )
+    parser.add_argument("--stride", type=int, default=5, help="Window hop in frames")
+    parser.add_argument("--min-confidence", type=float, default=0.25)
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes")
+    args = parser.parse_args()
+
+    videos = collect_videos(args.inputs)
+    if not videos:
+        raise RuntimeError("No input videos found.")
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    formats = ["srt", "json"] if args.format == "both" else [args.format]
+    stride = max(1, args.stride)
+    workers = max(1, min(args.workers, len(videos)))
+
+    print(f"[transcribe] videos: {len(videos)} | workers: {workers}")
+    failed = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(args.model,)) as executor:
+        future_map = {
+            executor.submit(
+                process_video, video, output_dir / stem, formats, stride, args.min_confidence, args.window_frames
+            ): video
+            for video, stem in videos
+        }
+        for index, future in enumerate(as_completed(future_map), start=1):
+            video = future_map[future]
+            try:
+                _, segment_count = future.result()
+                print(f"[{index}/{len(videos)}] OK   {video.name} ({segment_count} segments)")
+            except Exception as exc:
+                failed += 1
+                print(f"[{index}/{len(videos)}] FAIL {video.name}: {exc}")
+
+    print(f"[transcribe] done | failed: {failed} | output: {output_dir}")
+
+
+if __name__ == "__main__":
+    main()